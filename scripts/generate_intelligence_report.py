@@ -263,7 +263,7 @@ This section documents the complete data flow from source files to final enriche
 - Analyzed CPT code distribution for E&M visits
 - Calculated ratio of complex codes (99204-99205, 99214-99215) to total E&M codes
 - Low ratio (<0.30) indicates potential undercoding opportunity
-**Processing:** `workers/mine_cpt_codes.py` → `data/curated/staging/stg_undercoding_metrics.csv`  
+**Processing:** `workers/mine_cpt_codes.py` → `data/curated/staging/stg_undercoding_metrics.parquet`  
 **Integration:** `workers/pipeline_main.py::integrate_undercoding_metrics()`
 
 ### 2.6 Strategic Signals
@@ -439,7 +439,7 @@ Based on the ICP score, organizations are assigned to tiers:
 |--------|---------|--------|
 | `workers/build_seed.py` | Build initial seed from NPI Registry | `clinics_seed.csv` |
 | `workers/mine_physician_util.py` | Process Medicare utilization data | `stg_physician_util.parquet` |
-| `workers/mine_cpt_codes.py` | Analyze CPT codes for undercoding | `stg_undercoding_metrics.csv` |
+| `workers/mine_cpt_codes.py` | Analyze CPT codes for undercoding | `stg_undercoding_metrics.parquet` |
 | `workers/extract_fqhc_hcris.py` | Extract FQHC cost reports | `fqhc_enriched_2024.csv` |
 | `workers/pipeline_main.py` | Main integration pipeline | `clinics_enriched_scored.csv` |
 | `workers/score_icp.py` | ICP scoring engine | Scores embedded in output |
@@ -67,7 +67,7 @@ check_file_age() {
 # Step 1: CPT Code Mining (Undercoding Metrics)
 echo "📊 Step 1: CPT Code Mining"
 echo "─────────────────────────────"
-UNDERCODING_FILE="$STAGING_DIR/stg_undercoding_metrics.csv"
+UNDERCODING_FILE="$STAGING_DIR/stg_undercoding_metrics.parquet"
 STATUS=$(check_file_age "$UNDERCODING_FILE" $MAX_AGE_DAYS) || NEEDS_RUN=true
 
 if [[ "$NEEDS_RUN" == true ]]; then
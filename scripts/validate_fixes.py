@@ -16,12 +16,29 @@ Run this AFTER running the full scoring pipeline:
 """
 
 import pandas as pd
+import numpy as np
 import os
+import re
 import sys
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from workers.pipeline.score_icp_production import load_scored_clinics
+
 SCORED_FILE = os.path.join(ROOT, "data", "curated", "clinics_scored_final.csv")
 
+# Only the columns these checks read; missing ones are skipped on load
+NEEDED_COLUMNS = [
+    'org_name', 'segment_label', 'pain_label', 'total_psych_codes', 'total_eval_codes',
+    'total_procedure_codes', 'procedure_ratio', 'scoring_drivers',
+]
+
+# Patterns are compiled once and passed to pandas as compiled regexes
+MAJOR_SYSTEMS = ['FROEDTERT', 'MONTEFIORE', 'NORTH SHORE', 'SUTTER', 'KAISER', 'CLEVELAND CLINIC']
+MAJOR_SYSTEMS_RE = re.compile('(' + '|'.join(re.escape(system) for system in MAJOR_SYSTEMS) + ')', re.IGNORECASE)
+OLD_SEGMENT_RE = re.compile(r'Segment [A-F]')
+
 print("="*80)
 print(" GTM INTELLIGENCE FIX VALIDATION")
 print("="*80)
@@ -31,7 +48,7 @@ if not os.path.exists(SCORED_FILE):
     print("   Please run: python3 workers/pipeline/score_icp_production.py")
     sys.exit(1)
 
-df = pd.read_csv(SCORED_FILE, low_memory=False)
+df = load_scored_clinics(NEEDED_COLUMNS, path=SCORED_FILE)
 print(f"\n✅ Loaded {len(df):,} scored clinics")
 
 # ============================================================================
@@ -41,29 +58,38 @@ print("\n" + "="*80)
 print(" TEST 1: THERAPY RELEVANCE GATE")
 print("="*80)
 
-therapy_pain = df[df['pain_label'].str.contains('Therapy', na=False)].copy()
+# Scan the pain_label categories once; reused for TEST 1 and TEST 4
+pain_categories = df['pain_label'].cat.categories
+therapy_categories = pain_categories[pain_categories.str.contains('Therapy')]
+is_therapy = df['pain_label'].isin(therapy_categories).to_numpy()
+
+therapy_pain = df[is_therapy]
 print(f"\nTotal clinics with Therapy Pain: {len(therapy_pain):,}")
 
 # Calculate therapy percentage for those flagged
 if 'total_psych_codes' in df.columns and 'total_eval_codes' in df.columns:
-    def calc_psych_pct(row):
-        psych = row['total_psych_codes'] if pd.notna(row['total_psych_codes']) else 0
-        eval_codes = row['total_eval_codes'] if pd.notna(row['total_eval_codes']) else 0
-        total = psych + eval_codes
-        if total > 0:
-            return psych / total
-        else:
-            return 0
-
-    therapy_pain['psych_percentage'] = therapy_pain.apply(calc_psych_pct, axis=1)
+    psych = therapy_pain['total_psych_codes'].fillna(0)
+    eval_codes = therapy_pain['total_eval_codes'].fillna(0)
+    total = psych + eval_codes
+    # Column-wise division; clinics with no codes at all get 0%
+    therapy_pain = therapy_pain.assign(psych_percentage=(psych / total.where(total > 0)).fillna(0))
+
+    # Bucket psych % in a single pass: [0, 20%), [20%, 50%), [50%, ...)
+    psych_buckets = pd.cut(
+        therapy_pain['psych_percentage'],
+        bins=[-np.inf, 0.20, 0.50, np.inf],
+        labels=['<20%', '20-50%', '>=50%'],
+        right=False,
+    )
+    bucket_counts = psych_buckets.value_counts()
 
     # Expected: All therapy pain clinics should have >20% psych volume
-    low_psych = therapy_pain[therapy_pain['psych_percentage'] < 0.20]
+    low_psych = therapy_pain[psych_buckets == '<20%']
 
     print(f"\n📊 Therapy Pain Distribution by Psych %:")
-    print(f"   >50% psych volume: {len(therapy_pain[therapy_pain['psych_percentage'] >= 0.50]):,}")
-    print(f"   20-50% psych volume: {len(therapy_pain[(therapy_pain['psych_percentage'] >= 0.20) & (therapy_pain['psych_percentage'] < 0.50)]):,}")
-    print(f"   <20% psych volume: {len(low_psych):,} 🚨")
+    print(f"   >50% psych volume: {bucket_counts['>=50%']:,}")
+    print(f"   20-50% psych volume: {bucket_counts['20-50%']:,}")
+    print(f"   <20% psych volume: {bucket_counts['<20%']:,} 🚨")
 
     if len(low_psych) > 0:
         print(f"\n❌ FAIL: Found {len(low_psych):,} clinics with therapy pain but <20% psych volume")
@@ -76,12 +102,15 @@ else:
     print("\n⚠️  Cannot validate: total_psych_codes or total_eval_codes columns missing")
 
 # Check for major health systems with therapy pain
-major_systems = ['FROEDTERT', 'MONTEFIORE', 'NORTH SHORE', 'SUTTER', 'KAISER', 'CLEVELAND CLINIC']
-for system in major_systems:
-    system_therapy = therapy_pain[therapy_pain['org_name'].str.contains(system, case=False, na=False)]
-    if len(system_therapy) > 0:
+# One regex sweep over org_name; every match counts, so a name with two systems flags both
+matched_system = therapy_pain['org_name'].str.extractall(MAJOR_SYSTEMS_RE)[0].str.upper().droplevel('match')
+# Keep the first therapy-pain hit per system
+first_hits = matched_system.groupby(matched_system).head(1)
+system_hits = therapy_pain.loc[first_hits.index].assign(system=first_hits.to_numpy()).set_index('system')
+for system in MAJOR_SYSTEMS:
+    if system in system_hits.index:
         print(f"\n❌ FAIL: Found {system} with therapy pain")
-        print(system_therapy[['org_name', 'pain_label', 'total_psych_codes', 'total_eval_codes']].head(1).to_string(index=False))
+        print(system_hits.loc[[system], ['org_name', 'pain_label', 'total_psych_codes', 'total_eval_codes']].to_string(index=False))
 
 # ============================================================================
 # TEST 2: Segment Labeling
@@ -96,7 +125,7 @@ for seg, count in segment_dist.head(10).items():
     print(f"   {seg}: {count:,}")
 
 # Check for old A-F labels
-old_labels = df[df['segment_label'].str.contains('Segment [A-F]', na=False, regex=True)]
+old_labels = df[df['segment_label'].str.contains(OLD_SEGMENT_RE, na=False)]
 if len(old_labels) > 0:
     print(f"\n❌ FAIL: Found {len(old_labels):,} clinics with old Segment A-F labels")
     print("   This means the pipeline wasn't re-run after fixing segment labels")
@@ -118,12 +147,14 @@ print("="*80)
 if 'total_procedure_codes' in df.columns and 'procedure_ratio' in df.columns:
     print(f"\n✅ Procedure columns exist in scored data")
 
-    proc_data = df[df['total_procedure_codes'].gt(0)]
-    print(f"   Clinics with procedure data: {len(proc_data):,} ({len(proc_data)/len(df)*100:.1f}%)")
+    has_procedures = df['total_procedure_codes'].to_numpy() > 0
+    proc_ratios = df['procedure_ratio'].to_numpy()[has_procedures]
+    proc_count = int(has_procedures.sum())
+    print(f"   Clinics with procedure data: {proc_count:,} ({proc_count/len(df)*100:.1f}%)")
 
-    if len(proc_data) > 0:
-        print(f"   Average procedure ratio: {proc_data['procedure_ratio'].mean():.1%}")
-        print(f"   Median procedure ratio: {proc_data['procedure_ratio'].median():.1%}")
+    if proc_count > 0:
+        print(f"   Average procedure ratio: {np.nanmean(proc_ratios):.1%}")
+        print(f"   Median procedure ratio: {np.nanmedian(proc_ratios):.1%}")
 
         # Check for procedure alignment in drivers
         proc_drivers = df[df['scoring_drivers'].str.contains('Procedure Alignment', na=False)]
@@ -158,7 +189,7 @@ for label, count in pain_dist.items():
 
 # Expected: Most should be "Undercoding Pain" for E&M
 # Only specialized BH clinics should have therapy pain
-therapy_total = pain_dist[pain_dist.index.str.contains('Therapy', na=False)].sum()
+therapy_total = int(is_therapy.sum())
 print(f"\nTotal Therapy Pain: {therapy_total:,} ({therapy_total/len(df)*100:.1f}%)")
 
 if therapy_total / len(df) > 0.20:
@@ -177,7 +208,7 @@ issues = []
 
 # Check therapy gate
 if 'total_psych_codes' in df.columns:
-    therapy_low_pct = len(therapy_pain[therapy_pain['psych_percentage'] < 0.20]) if len(therapy_pain) > 0 else 0
+    therapy_low_pct = len(low_psych) if len(therapy_pain) > 0 else 0
     if therapy_low_pct > 0:
         issues.append(f"Therapy relevance gate: {therapy_low_pct:,} clinics with therapy pain but <20% psych volume")
 
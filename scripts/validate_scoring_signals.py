@@ -17,24 +17,63 @@ Check C: The "Zero Check"
 - Expectation: Should find few or no such clinics, validating the "Relevance Gate".
 """
 import pandas as pd
+import numpy as np
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from workers.pipeline.score_icp_production import load_scored_clinics
 
 # --- Configuration ---
 SCORED_FILE = "data/curated/clinics_scored_final.csv"
-UNDERCODING_METRICS_FILE = "data/curated/staging/stg_undercoding_metrics.csv"
+UNDERCODING_METRICS_FILE = "data/curated/staging/stg_undercoding_metrics.parquet"
 PSYCH_METRICS_FILE = "data/curated/staging/stg_psych_metrics.csv"
 
+# Only the scored-file columns the checks read; missing ones are skipped on load
+NEEDED_COLUMNS = [
+    'npi', 'org_name', 'pain_label', 'scoring_track', 'score_pain_total',
+    'total_eval_codes', 'total_psych_codes',
+]
+
 def print_header(title):
     print("\n" + "="*80)
     print(f" {title}")
     print("="*80)
 
+def therapy_pain_mask(df):
+    """Boolean array of rows whose pain_label mentions Therapy (scans categories, not rows)."""
+    categories = df['pain_label'].cat.categories
+    return df['pain_label'].isin(categories[categories.str.contains('Therapy')]).to_numpy()
+
+def load_metrics(path):
+    """Load a staging metrics file indexed by NPI (empty frame if it hasn't been mined)."""
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    if path.endswith('.parquet'):
+        metrics_df = pd.read_parquet(path)
+        metrics_df = metrics_df.astype({'npi': str})
+    else:
+        metrics_df = pd.read_csv(path, dtype={'npi': str})
+    return index_by_npi(metrics_df)
+
+def index_by_npi(metrics_df):
+    """Index a staging metrics frame by NPI so per-clinic lookups are hash lookups."""
+    if metrics_df.empty:
+        return metrics_df
+    # NPIs in CSVs might be float-formatted ("1234567890.0"); normalize once
+    npi = metrics_df['npi'].str.replace(r'\.0$', '', regex=True)
+    return metrics_df.assign(npi=npi).set_index('npi')
+
 def check_a_em_bell_curve(df, undercoding_df):
     """Picks 3 'Green' clinics with E&M data and checks their code distribution."""
     print_header("Check A: The E&M Bell Curve")
     
     # Ensure there's data to sample from
-    green_clinics_with_data = df[(df['score_pain_total'] < 15) & (df['total_eval_codes'] > 100)]
+    pain = df['score_pain_total'].to_numpy()
+    eval_codes = df['total_eval_codes'].to_numpy()
+    green_clinics_with_data = df.iloc[np.flatnonzero((pain < 15) & (eval_codes > 100))]
     if green_clinics_with_data.empty:
         print("No 'Green' clinics with sufficient E&M codes (>100) found to test.")
         return
@@ -46,15 +85,13 @@ def check_a_em_bell_curve(df, undercoding_df):
         name = clinic['org_name']
         print(f"\n--- Analyzing Green Clinic: {name} (NPI: {npi}) ---")
         
-        # NPIs in CSVs might be float, ensure string comparison
-        clinic_metrics = undercoding_df[undercoding_df['npi'].astype(str).str.startswith(npi)]
-        
-        if clinic_metrics.empty:
+        if npi not in undercoding_df.index:
             print("No undercoding metrics found for this NPI.")
             continue
-            
-        total_em_services = clinic_metrics['total_eval_codes'].iloc[0]
-        level4_5_services = clinic_metrics['count_level_4_5'].iloc[0]
+
+        # First matching row as a plain array; duplicate NPIs keep the first
+        metrics_row = undercoding_df.loc[[npi], ['total_eval_codes', 'count_level_4_5']].to_numpy()[0]
+        total_em_services, level4_5_services = metrics_row
 
         if total_em_services > 0:
             level4_5_ratio = level4_5_services / total_em_services
@@ -72,9 +109,9 @@ def check_b_therapy_cliff(df, psych_df):
     print_header("Check B: The Therapy Cliff")
 
     # Ensure there's data to sample from
-    red_clinics_with_data = df[(df['score_pain_total'] > 30) & 
-                               (df['pain_label'].str.contains("Therapy", na=False)) & 
-                               (df['total_psych_codes'] > 100)]
+    pain = df['score_pain_total'].to_numpy()
+    psych_codes = df['total_psych_codes'].to_numpy()
+    red_clinics_with_data = df.iloc[np.flatnonzero((pain > 30) & therapy_pain_mask(df) & (psych_codes > 100))]
     if red_clinics_with_data.empty:
         print("No 'Red' therapy-pain clinics with sufficient psych codes (>100) found to test.")
         return
@@ -86,15 +123,13 @@ def check_b_therapy_cliff(df, psych_df):
         name = clinic['org_name']
         print(f"\n--- Analyzing Red Clinic: {name} (NPI: {npi}) ---")
 
-        clinic_metrics = psych_df[psych_df['npi'].astype(str).str.startswith(npi)]
-        
-        if clinic_metrics.empty:
+        if npi not in psych_df.index:
             print(f"No psych metrics found for this NPI ({npi}).")
             continue
-            
-        high_code_services = clinic_metrics['90837'].iloc[0]
-        mid_code_services = clinic_metrics['90834'].iloc[0]
-        
+
+        metrics_row = psych_df.loc[[npi], ['90837', '90834']].to_numpy()[0]
+        high_code_services, mid_code_services = metrics_row
+
         total_therapy_services = high_code_services + mid_code_services
 
         if total_therapy_services > 0:
@@ -113,12 +148,11 @@ def check_c_zero_check(df):
     """Finds clinics with high therapy pain but low therapy claim volume."""
     print_header("Check C: The 'Zero' Check (Therapy Relevance Gate Validation)")
     
-    high_pain_low_volume = df[
-        (df['scoring_track'] == 'AMBULATORY') &
-        (df['score_pain_total'] > 30) &
-        (df['pain_label'].str.contains("Therapy", na=False)) &
-        (df['total_psych_codes'] < 100)
-    ]
+    is_ambulatory = df['scoring_track'].to_numpy() == 'AMBULATORY'
+    pain = df['score_pain_total'].to_numpy()
+    psych_codes = df['total_psych_codes'].to_numpy()
+    mask = is_ambulatory & (pain > 30) & therapy_pain_mask(df) & (psych_codes < 100)
+    high_pain_low_volume = df.iloc[np.flatnonzero(mask)]
     
     count = len(high_pain_low_volume)
     
@@ -135,11 +169,16 @@ def main():
     if not os.path.exists(SCORED_FILE):
         print(f"❌ Scored file not found at: {SCORED_FILE}")
         return
-        
-    df = pd.read_csv(SCORED_FILE, low_memory=False, dtype={'npi': str})
-    
-    undercoding_df = pd.read_csv(UNDERCODING_METRICS_FILE, dtype={'npi': str}) if os.path.exists(UNDERCODING_METRICS_FILE) else pd.DataFrame()
-    psych_df = pd.read_csv(PSYCH_METRICS_FILE, dtype={'npi': str}) if os.path.exists(PSYCH_METRICS_FILE) else pd.DataFrame()
+
+    # Staging metrics load on worker threads while the scored file is read below
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        undercoding_future = executor.submit(load_metrics, UNDERCODING_METRICS_FILE)
+        psych_future = executor.submit(load_metrics, PSYCH_METRICS_FILE)
+
+        df = load_scored_clinics(NEEDED_COLUMNS, dtypes={'npi': str}, path=SCORED_FILE)
+
+        undercoding_df = undercoding_future.result()
+        psych_df = psych_future.result()
 
     # Run checks
     check_a_em_bell_curve(df, undercoding_df)
@@ -20,7 +20,7 @@ PHYSICIAN_UTIL = os.path.join(ROOT, "data", "raw", "physician_utilization",
                                "Medicare Physician & Other Practitioners - by Provider and Service", 
                                "2023", "MUP_PHY_R25_P05_V20_D23_Prov_Svc.csv")
 PECOS_BRIDGE = os.path.join(ROOT, "data", "curated", "staging", "stg_pecos_bridge.csv")
-OUTPUT_FILE = os.path.join(ROOT, "data", "curated", "staging", "stg_undercoding_metrics.csv")
+OUTPUT_FILE = os.path.join(ROOT, "data", "curated", "staging", "stg_undercoding_metrics.parquet")
 
 # EXPANDED E&M CODE RANGES
 EM_CODES = {
@@ -171,7 +171,7 @@ def extract_undercoding():
     
     # Keep only needed columns
     output_cols = ['npi', 'total_eval_codes', 'undercoding_ratio']
-    clinic_em[output_cols].to_csv(OUTPUT_FILE, index=False)
+    clinic_em[output_cols].to_parquet(OUTPUT_FILE, engine='pyarrow', compression='snappy', index=False)
     
     print(f"✅ Saved to {OUTPUT_FILE}")
     
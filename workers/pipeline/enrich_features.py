@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 from pathlib import Path
 import numpy as np
@@ -143,6 +144,49 @@ def assign_segment(row):
     # 4. Default Fallback
     return "Multi-specialty"
 
+# assign_segment's taxonomy rules as one regex: the first ';'-separated code that
+# matches any rule decides, and alternation order mirrors the if-chain within a code
+TAXONOMY_SEGMENT_RE = re.compile(r'(?:^|;)\s*(28|261QU0200X(?=\s*(?:;|\Z))|2[01]|26|25|10|19)')
+TAXONOMY_RULE_SEGMENTS = {
+    '28': "Hospital",
+    '261QU0200X': "Urgent Care",
+    '20': "Private Practice",
+    '21': "Private Practice",
+    '26': "Ambulatory Clinic",
+    '25': "Home Health",
+    '10': "Behavioral Health",
+    '19': "Behavioral Health",
+}
+
+# Name-keyword fallback, in assign_segment's priority order
+NAME_SEGMENT_RULES = [
+    ("Hospital", re.compile("HOSPITAL|MEDICAL CENTER|HEALTH SYSTEM")),
+    ("Urgent Care", re.compile("URGENT CARE")),
+    ("Behavioral Health", re.compile("BEHAVIORAL|MENTAL HEALTH|PSYCH|COUNSELING")),
+    ("Home Health", re.compile("HOME HEALTH")),
+]
+
+def assign_segment_vec(df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized assign_segment over a frame: FQHC flag mask, then one regex
+    sweep over taxonomy, then keyword masks over org_name for the rest.
+    """
+    segment = pd.Series("Multi-specialty", index=df.index, dtype=object)
+
+    if "org_name" in df.columns:
+        org = df["org_name"].astype(object).map(str).str.upper()
+        for label, pattern in reversed(NAME_SEGMENT_RULES):
+            segment = segment.mask(org.str.contains(pattern), label)
+
+    if "taxonomy" in df.columns:
+        tax = df["taxonomy"].where(df["taxonomy"].notna(), "").astype(object).map(str)
+        rule = tax.str.extract(TAXONOMY_SEGMENT_RE, expand=False)
+        segment = segment.mask(rule.notna(), rule.map(TAXONOMY_RULE_SEGMENTS))
+
+    if "fqhc_flag" in df.columns:
+        segment = segment.mask(df["fqhc_flag"] == 1, "FQHC")
+    return segment
+
 def main():
     staging = Path(STAGING_DIR)
     npi = read_parquet(str(staging / "stg_npi_orgs.parquet"))
@@ -214,7 +258,7 @@ def main():
 
     # --- CRITICAL PRINT STATEMENT ---
     print("Assigning segments (Enhanced A-F Logic)...")
-    df["segment_label"] = df.apply(assign_segment, axis=1)
+    df["segment_label"] = assign_segment_vec(df)
     
     # Scoring Prep (v2 with descriptive labels)
     df["segment_fit"] = 8.0 # base score
@@ -16,8 +16,14 @@ Interpretation:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration - Go up 2 levels from workers/pipeline/ to project root
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -32,13 +38,17 @@ PECOS_REASSIGN = os.path.join(PECOS_DIR, "PPEF_Reassignment_Extract_2025.10.01.c
 PECOS_ENROLL = os.path.join(PECOS_DIR, "PPEF_Enrollment_Extract_2025.10.01.csv")
 
 # Output File
-OUTPUT_FILE = os.path.join(DATA_STAGING, "stg_undercoding_metrics.csv")
+OUTPUT_FILE = os.path.join(DATA_STAGING, "stg_undercoding_metrics.parquet")
 
 # Target Codes
 LEVEL_3_CODES = ['99203', '99213']
 LEVEL_4_5_CODES = ['99204', '99205', '99214', '99215']
 ALL_TARGET_CODES = set(LEVEL_3_CODES + LEVEL_4_5_CODES)
 
+# E&M code -> level bucket, tagged on ingest so aggregation never pivots by code
+LEVEL_MAP = {code: 'count_level_3' for code in LEVEL_3_CODES}
+LEVEL_MAP.update({code: 'count_level_4_5' for code in LEVEL_4_5_CODES})
+
 # Procedure Code Ranges (CPT codes for procedures, excluding E&M)
 # E&M codes are 99xxx, Procedures are typically 10000-69999
 def is_procedure_code(code):
@@ -53,6 +63,31 @@ def is_procedure_code(code):
     except (ValueError, TypeError):
         return False
 
+def procedure_code_mask(codes):
+    """Vectorized is_procedure_code over a Series of HCPCS codes."""
+    code_num = pd.to_numeric(codes.str[:5], errors='coerce')
+    return code_num.between(10000, 69999)
+
+def utilization_batches(batch_size=100000):
+    """
+    Stream the utilization CSV as pandas chunks, keeping only E&M target and
+    procedure-range rows. The HCPCS predicate runs inside the Arrow scanner,
+    so non-target rows are never converted to pandas.
+    """
+    csv_format = ds.CsvFileFormat(convert_options=pacsv.ConvertOptions(
+        # float32 service counts halve the bytes moved per row; NPIs need int64 (10 digits)
+        column_types={'Rndrng_NPI': pa.int64(), 'HCPCS_Cd': pa.string(), 'Tot_Srvcs': pa.float32()}
+    ))
+    dataset = ds.dataset(UTIL_FILE, format=csv_format)
+
+    hcpcs = pc.field('HCPCS_Cd')
+    target_filter = hcpcs.isin(list(ALL_TARGET_CODES)) | pc.match_substring_regex(hcpcs, pattern=r'^[1-6][0-9]{4}')
+
+    for batch in dataset.to_batches(columns=['Rndrng_NPI', 'HCPCS_Cd', 'Tot_Srvcs'],
+                                    filter=target_filter, batch_size=batch_size):
+        if batch.num_rows > 0:
+            yield batch.to_pandas()
+
 def load_pecos_bridge():
     print("   Loading PECOS Reassignment Bridge...")
     if not os.path.exists(PECOS_REASSIGN) or not os.path.exists(PECOS_ENROLL):
@@ -78,10 +113,96 @@ def load_pecos_bridge():
     print(f"   ✅ Built Bridge: {len(bridge):,} links (Indiv -> Org)")
     return bridge
 
+def bounded_map(executor, fn, iterable, max_in_flight):
+    """Like executor.map, but only keeps max_in_flight items submitted at once."""
+    pending = deque()
+    for item in iterable:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def sort_bridge(bridge):
+    """Bridge as (indiv_npi, org_npi) arrays sorted by indiv_npi, for searchsorted lookups."""
+    indiv = bridge['indiv_npi'].to_numpy()
+    order = np.argsort(indiv, kind='stable')
+    return indiv[order], bridge['org_npi'].to_numpy()[order]
+
+def lookup_org_npis(sorted_bridge, npis):
+    """
+    Expand individual NPIs to every Org NPI they reassign benefits to.
+
+    Returns (row positions into npis, org_npi per position); unmatched NPIs are
+    dropped and a multi-org NPI repeats once per org, like an inner merge.
+    """
+    indiv, org = sorted_bridge
+    left = np.searchsorted(indiv, npis, side='left')
+    counts = np.searchsorted(indiv, npis, side='right') - left
+    rows = np.repeat(np.arange(len(npis)), counts)
+    # Walk each row's run of matches: run start + offset within the run
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return rows, org[np.repeat(left, counts) + offsets]
+
+def aggregate_chunk(chunk, sorted_bridge):
+    """
+    Aggregate one utilization chunk by Organization NPI.
+
+    Args:
+        chunk: Utilization rows with ['Rndrng_NPI', 'HCPCS_Cd', 'Tot_Srvcs']
+        sorted_bridge: Bridge arrays from sort_bridge, or None
+
+    Returns:
+        Tuple of (E&M totals by (npi, level) or None, procedure totals by npi or None,
+        bridge-matched E&M rows, chunk rows)
+    """
+    agg = None
+    proc_agg = None
+    matched_rows = 0
+
+    # Classify every row once: E&M level (NaN if not E&M) and procedure range.
+    # The two code sets are disjoint (99xxx vs 10000-69999).
+    codes = chunk['HCPCS_Cd']
+    level = codes.map(LEVEL_MAP)
+    is_em = level.notna().to_numpy()
+    is_procedure = procedure_code_mask(codes).to_numpy()
+
+    tagged = chunk.assign(level=level)[is_em | is_procedure]
+    npi_col = 'Rndrng_NPI'
+    if sorted_bridge is not None:
+        # Look up Org NPI in the pre-sorted bridge, once for both code types
+        rows, org_npi = lookup_org_npis(sorted_bridge, tagged['Rndrng_NPI'].to_numpy())
+        tagged = tagged.iloc[rows].assign(org_npi=org_npi)
+        npi_col = 'org_npi'
+    # else: fallback uses individual NPI as proxy for org
+    tagged_is_em = tagged['level'].notna()
+
+    # Process E&M codes: aggregate by Org NPI and E&M level
+    if is_em.any():
+        em_rows = tagged[tagged_is_em]
+        if sorted_bridge is not None:
+            matched_rows = len(em_rows)
+        agg = em_rows.groupby([npi_col, 'level'])['Tot_Srvcs'].sum().rename_axis(['npi', 'level'])
+
+    # Process procedure codes: aggregate by Org NPI (total procedure volume)
+    if is_procedure.any():
+        procedure_rows = tagged[~tagged_is_em]
+        proc_agg = procedure_rows.groupby(npi_col)['Tot_Srvcs'].sum().rename_axis('npi')
+
+    return agg, proc_agg, matched_rows, len(chunk)
+
+def accumulate(totals, chunk_totals):
+    """Add a chunk's per-key sums into the running float64 totals."""
+    chunk_totals = chunk_totals.astype('float64')
+    if totals is None:
+        return chunk_totals
+    return totals.add(chunk_totals, fill_value=0)
+
 def process_utilization_with_bridge(bridge):
     """
     Process Medicare utilization data in chunks, merging with PECOS bridge
-    to aggregate directly by Organization NPI.
+    to aggregate directly by Organization NPI. Chunks are aggregated on a
+    thread pool; pandas merge/groupby release the GIL for most of the work.
 
     Args:
         bridge: DataFrame with columns ['indiv_npi', 'org_npi'] or None
@@ -91,87 +212,49 @@ def process_utilization_with_bridge(bridge):
     """
     print(f"🚀 Starting CPT Mining on {UTIL_FILE}")
 
-    chunk_size = 100000
-    org_chunks = []
-    procedure_chunks = []
+    # Running float64 totals, so memory is O(#orgs) rather than O(filtered rows)
+    em_totals = None          # Series indexed by (npi, level)
+    procedure_totals = None   # Series indexed by npi
     total_rows = 0
     matched_rows = 0
 
-    # Process in chunks
-    for chunk in pd.read_csv(UTIL_FILE, chunksize=chunk_size,
-                            usecols=['Rndrng_NPI', 'HCPCS_Cd', 'Tot_Srvcs'],
-                            dtype={'Rndrng_NPI': 'int64', 'HCPCS_Cd': str, 'Tot_Srvcs': float}):
-
-        # Filter for E&M target codes
-        filtered = chunk[chunk['HCPCS_Cd'].isin(ALL_TARGET_CODES)].copy()
-
-        # Filter for procedure codes
-        chunk['is_procedure'] = chunk['HCPCS_Cd'].apply(is_procedure_code)
-        procedure_filtered = chunk[chunk['is_procedure']].copy()
-
-        # Process E&M codes
-        if not filtered.empty:
-            if bridge is not None:
-                # Merge with bridge to get Org NPI
-                filtered = filtered.merge(bridge, left_on='Rndrng_NPI', right_on='indiv_npi', how='inner')
-                matched_rows += len(filtered)
-
-                # Aggregate by Org NPI and Code
-                agg = filtered.groupby(['org_npi', 'HCPCS_Cd'])['Tot_Srvcs'].sum().reset_index()
-                agg.rename(columns={'org_npi': 'npi'}, inplace=True)
-            else:
-                # Fallback: use individual NPI as proxy for org
-                agg = filtered.groupby(['Rndrng_NPI', 'HCPCS_Cd'])['Tot_Srvcs'].sum().reset_index()
-                agg.rename(columns={'Rndrng_NPI': 'npi'}, inplace=True)
-
-            org_chunks.append(agg)
-
-        # Process procedure codes
-        if not procedure_filtered.empty:
-            if bridge is not None:
-                # Merge with bridge to get Org NPI
-                procedure_filtered = procedure_filtered.merge(bridge, left_on='Rndrng_NPI', right_on='indiv_npi', how='inner')
-
-                # Aggregate by Org NPI (total procedure volume)
-                proc_agg = procedure_filtered.groupby('org_npi')['Tot_Srvcs'].sum().reset_index()
-                proc_agg.rename(columns={'org_npi': 'npi', 'Tot_Srvcs': 'total_procedure_codes'}, inplace=True)
-            else:
-                # Fallback: use individual NPI as proxy for org
-                proc_agg = procedure_filtered.groupby('Rndrng_NPI')['Tot_Srvcs'].sum().reset_index()
-                proc_agg.rename(columns={'Rndrng_NPI': 'npi', 'Tot_Srvcs': 'total_procedure_codes'}, inplace=True)
-
-            procedure_chunks.append(proc_agg)
-        
-        total_rows += len(chunk)
-        sys.stdout.write(f"\r   Processed {total_rows:,} rows...")
-        sys.stdout.flush()
-        
+    # Sort the bridge once; each chunk then binary-searches it instead of
+    # hashing the whole bridge per merge. Every match is kept (not a dict map),
+    # so individuals that reassign benefits to several organizations count for each.
+    sorted_bridge = sort_bridge(bridge) if bridge is not None else None
+
+    # Aggregate chunks in parallel (already pre-filtered to target codes by the scanner)
+    max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = bounded_map(executor, lambda chunk: aggregate_chunk(chunk, sorted_bridge),
+                              utilization_batches(), max_in_flight=2 * max_workers)
+        for agg, proc_agg, chunk_matched, chunk_rows in results:
+            if agg is not None:
+                em_totals = accumulate(em_totals, agg)
+            if proc_agg is not None:
+                procedure_totals = accumulate(procedure_totals, proc_agg)
+            matched_rows += chunk_matched
+
+            total_rows += chunk_rows
+            sys.stdout.write(f"\r   Processed {total_rows:,} target rows...")
+            sys.stdout.flush()
+
     print("\n   ✅ Finished processing chunks.")
 
     if bridge is not None:
         print(f"   Mapped {matched_rows:,} utilization records to organizations via bridge.")
 
-    if not org_chunks:
+    if em_totals is None:
         print("   ⚠️  No E&M target codes found.")
         return None
 
-    # Combine all E&M chunks and aggregate by Org NPI
+    # Reshape the E&M totals by Org NPI
     print("   Aggregating E&M results by Organization NPI...")
-    full_df = pd.concat(org_chunks, ignore_index=True)
-    final_agg = full_df.groupby(['npi', 'HCPCS_Cd'])['Tot_Srvcs'].sum().reset_index()
-
-    # Pivot to get columns
-    print("   Pivoting E&M data...")
-    pivot = final_agg.pivot(index='npi', columns='HCPCS_Cd', values='Tot_Srvcs').fillna(0)
-
-    # Calculate sums for levels
-    # Note: columns might be missing if no codes found for that specific code
-    for code in ALL_TARGET_CODES:
-        if code not in pivot.columns:
-            pivot[code] = 0
-
-    pivot['count_level_3'] = pivot[LEVEL_3_CODES].sum(axis=1)
-    pivot['count_level_4_5'] = pivot[LEVEL_4_5_CODES].sum(axis=1)
+    # One column per level; a level with no codes anywhere is filled with 0
+    pivot = (
+        em_totals.unstack('level', fill_value=0)
+        .reindex(columns=['count_level_3', 'count_level_4_5'], fill_value=0)
+    )
     pivot['total_eval_codes'] = pivot['count_level_3'] + pivot['count_level_4_5']
 
     # Filter for meaningful volume (e.g., at least 10 codes)
@@ -187,10 +270,9 @@ def process_utilization_with_bridge(bridge):
     print(f"   Identified {len(pivot):,} organizations with relevant E&M volume.")
 
     # Process procedure data
-    if procedure_chunks:
+    if procedure_totals is not None:
         print("   Aggregating procedure results by Organization NPI...")
-        proc_df = pd.concat(procedure_chunks, ignore_index=True)
-        proc_final = proc_df.groupby('npi')['total_procedure_codes'].sum().reset_index()
+        proc_final = procedure_totals.rename('total_procedure_codes').reset_index()
         print(f"   Identified {len(proc_final):,} organizations with procedure volume.")
 
         # Merge procedure data with E&M data
@@ -226,7 +308,7 @@ def main():
     
     if org_metrics is not None:
         # 3. Save
-        org_metrics.to_csv(OUTPUT_FILE, index=False)
+        org_metrics.to_parquet(OUTPUT_FILE, engine='pyarrow', compression='snappy', index=False)
         print(f"\n   ✅ Saved Undercoding Metrics to: {OUTPUT_FILE}")
         print(f"   📊 Total Organizations: {len(org_metrics):,}")
 
@@ -19,7 +19,7 @@ from typing import Dict, Any
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
 # Import Scoring Engine
-from workers.pipeline.score_icp_production import calculate_score
+from workers.pipeline.score_icp_production import calculate_score, save_scored_parquet
 
 # Configuration
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -55,7 +55,7 @@ def ensure_staging_file(file_path: str, miner_script: str, max_age_days: int = 7
     Ensure staging file exists and is fresh. Run miner if needed.
 
     Args:
-        file_path: Path to staging file (e.g., stg_undercoding_metrics.csv)
+        file_path: Path to staging file (e.g., stg_undercoding_metrics.parquet)
         miner_script: Path to miner script relative to ROOT (e.g., workers/pipeline/mine_cpt_codes.py)
         max_age_days: Maximum age of staging file before re-running miner
     """
@@ -302,7 +302,7 @@ def integrate_physician_util(df):
 def integrate_undercoding_metrics(df):
     print_section("1B. INTEGRATING UNDERCODING METRICS")
 
-    path = os.path.join(DATA_STAGING, "stg_undercoding_metrics.csv")
+    path = os.path.join(DATA_STAGING, "stg_undercoding_metrics.parquet")
 
     # NEW: Auto-run miner if needed
     ensure_staging_file(
@@ -316,7 +316,7 @@ def integrate_undercoding_metrics(df):
         raise FileNotFoundError(f"Staging file missing: {path}. Miner execution may have failed.")
 
     print(f"   Loading {path}...")
-    metrics = pd.read_csv(path)
+    metrics = pd.read_parquet(path)
 
     # Ensure NPI is int64 (filter out invalid NPIs instead of converting NULL to 0)
     metrics['npi'] = pd.to_numeric(metrics['npi'], errors='coerce')
@@ -1467,6 +1467,7 @@ def run_pipeline():
     print_section("SAVING FINAL RESULTS")
     final_df.to_csv(scored_file, index=False) # Save again with phones
     print(f"   Saved to: {scored_file}")
+    save_scored_parquet(final_df, scored_file.replace(".csv", ".parquet"))
     
     # 5. Report
     print_section("DATA CAPTURE REPORT")
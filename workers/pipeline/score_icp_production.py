@@ -10,12 +10,20 @@ CHANGELOG v12.0:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import os
+import re
 import math
+from functools import lru_cache
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 INPUT_FILE = os.path.join(ROOT, "data", "curated", "clinics_enriched_scored.csv")
 OUTPUT_FILE = os.path.join(ROOT, "data", "curated", "clinics_scored_final.csv")
+# Columnar copy of OUTPUT_FILE for downstream readers (validate scripts)
+OUTPUT_PARQUET = OUTPUT_FILE.replace(".csv", ".parquet")
+# Arrow IPC copy for services that memory-map the scores instead of parsing them
+OUTPUT_ARROW = OUTPUT_FILE.replace(".csv", ".arrow")
 
 MIPS_STAGING = os.path.join(ROOT, "data", "staging", "stg_mips_org_scores.csv")
 HPSA_MUA_STAGING = os.path.join(ROOT, "data", "staging", "stg_hpsa_mua_flags.csv")
@@ -44,6 +52,15 @@ SPECIALTY_PROCEDURE_TARGETS = {
 # Minimum procedure deficit to flag (e.g., 20% below target)
 PROCEDURE_DEFICIT_THRESHOLD = 0.20
 
+# Segments the procedure alignment audit applies to
+PROCEDURE_SEGMENTS = ['Private Practice', 'Specialty Group']
+
+# Data quality status of the procedure alignment audit, per clinic
+PROCEDURE_STATUS_NA = 0
+PROCEDURE_STATUS_HAS_DATA = 1
+PROCEDURE_STATUS_MISSING = 2
+PROCEDURE_STATUS_LOW_VOLUME = 3
+
 # Data quality tracking for procedure alignment
 PROCEDURE_DATA_QUALITY_STATS = {
     'procedure_heavy_specialties': 0,
@@ -54,6 +71,41 @@ PROCEDURE_DATA_QUALITY_STATS = {
     'missing_by_specialty': {}
 }
 
+# Text columns pinned on load so the pyarrow reader never infers them as numbers.
+# Everything else keeps its inferred dtype: the scored CSV carries every input
+# column through, so narrower floats would change the written values.
+INPUT_DTYPES = {'taxonomy': str, 'segment_label': str, 'org_name': str, 'volume_source': str}
+
+# Output columns of calculate_row_score / score_dataframe, in order
+SCORE_COLUMNS = [
+    'icp_score', 'icp_tier', 'segment_label', 'fqhc_flag', 'scoring_track', 'pain_label', 'data_confidence', 'scoring_drivers',
+    'score_pain_total', 'score_pain_signal', 'score_pain_volume', 'score_pain_margin', 'score_pain_compliance',
+    'score_fit_total', 'score_fit_align', 'score_fit_complex', 'score_fit_chaos', 'score_fit_risk', 'score_fit_mips', 'score_fit_hpsa_mua',
+    'score_strat_total', 'score_strat_deal', 'score_strat_expand', 'score_strat_ref', 'score_bonus_strategic_scale', 'score_base_before_bonus',
+    'metric_est_revenue', 'metric_used_volume', 'volume_unit',
+    'score_reasoning_pain', 'score_reasoning_fit', 'score_reasoning_strategy',
+]
+
+# Label columns score_dataframe emits as categoricals (int8 codes + shared categories)
+TRACK_DTYPE = pd.CategoricalDtype(['AMBULATORY', 'BEHAVIORAL', 'POST_ACUTE'])
+TIER_DTYPE = pd.CategoricalDtype(['Tier 1', 'Tier 2', 'Tier 3', 'Tier 4'])
+PAIN_LABEL_DTYPE = pd.CategoricalDtype([
+    'Low Pain - Strong Documentation', 'Procedure Alignment Pain', 'Therapy Undercoding Pain', 'Therapy Audit Risk',
+    'Audit Risk Pain', 'Therapy Coding Risk', 'Undercoding Pain', 'Margin Pressure',
+])
+
+# Fit points for how well each (non-behavioral) segment aligns with the ICP; others get 5
+SEGMENT_ALIGNMENT_SCORES = {
+    'FQHC': 15,
+    'Urgent Care': 15,
+    'Behavioral Health': 10,
+    'Private Practice': 10,
+    'Hospital': 8,
+    'Home Health': 5,
+    'Ambulatory Clinic': 5,
+    'Multi-specialty': 5
+}
+
 # Taxonomy to specialty name mapping
 TAXONOMY_TO_SPECIALTY = {
     '213E': 'Podiatry',
@@ -67,36 +119,103 @@ TAXONOMY_TO_SPECIALTY = {
     '207T': 'Pain Medicine'
 }
 
+def _isna(value):
+    """Scalar missing-value check without pandas dispatch (NaN is the only value unequal to itself)."""
+    return value is None or value is pd.NA or value != value
+
+def _is_true(value):
+    """Flag check for CSV columns that hold booleans as True/False or 'true'/'false' strings."""
+    return str(value).lower() == 'true'
+
+def _round(value, ndigits=1):
+    """
+    Built-in round() on the Python float value. np.float64.__round__ follows
+    np.round instead, so without this the rounding rule would depend on whether
+    a score was computed from NumPy or Python scalars.
+    """
+    return round(float(value) if isinstance(value, np.floating) else value, ndigits)
+
+def round_vec(values, ndigits=1):
+    """
+    Vectorized built-in round(), so vector scores round like the scalar scorers.
+    np.round scales by 10**ndigits before rounding, which can push a value stored
+    just below a halfway point (13.05 is 13.0500...07, 0.15 is 0.1499...94) to
+    the other side; values near a halfway point are re-rounded with round().
+    """
+    values = np.asarray(values, dtype=float)
+    rounded = np.round(values, ndigits)
+    scaled = values * 10.0 ** ndigits
+    with np.errstate(invalid='ignore'):
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(value, ndigits) for value in values[near_half].tolist()]
+    return rounded
+
+# Org-name keywords that route a clinic to the BEHAVIORAL track
+BEHAVIORAL_KEYWORDS = ['BEHAVIORAL', 'PSYCH', 'MENTAL HEALTH', 'COUNSELING', 'THERAPY']
+BEHAVIORAL_NAME_RE = re.compile('|'.join(map(re.escape, BEHAVIORAL_KEYWORDS)))
+
+# Driver templates, %-formatted by the scorers (percent fields take ratio * 100)
+DRIVER_THERAPY_UNDERCODING = "💰 Therapy Undercoding (%.2f)"
+DRIVER_COMPLIANCE_AUDIT_RISK = "🚨 Compliance/Audit Risk (%.2f)"
+DRIVER_THERAPY_AUDIT_RISK = "🚨 Therapy Audit Risk (%.2f)"
+DRIVER_THERAPY_CODING_RISK = "Therapy Coding Risk (%.2f)"
+DRIVER_FINANCIAL_DISTRESS = "Financial Distress (margin %.1f%%)"
+DRIVER_MARGIN_PRESSURE = "Margin Pressure (margin %.1f%%)"
+DRIVER_PROCEDURE_ALIGNMENT = "⚠️ Procedure Alignment (%.0f%% vs %.0f%% expected)"
+DRIVER_STRONG_EM = "✅ Strong E&M Documentation (%.2f)"
+DRIVER_SEVERE_UNDERCODING = "🩸 SEVERE Undercoding (%.2f)"
+DRIVER_EM_UNDERCODING = "E&M Undercoding (%.2f)"
+DRIVER_HIGH_VOLUME = "High Volume (%dk %s)"
+DRIVER_MULTI_SITE = "Multi-Site Network (%d sites)"
+DRIVER_STRONG_REVENUE = "Strong Rev ($%.1fM)"
+DRIVER_BENCHMARK = {track: f"{track} Track: Benchmark" for track in ['AMBULATORY', 'BEHAVIORAL', 'POST_ACUTE']}
+
+# volume_source markers (upper-cased) that count as verified volume
+VERIFIED_VOLUME_RE = re.compile('UDS|VERIFIED|CLAIMS|HRSA')
+
+# Procedure-heavy prefixes as lookup arrays; a taxonomy maps to an index into these (-1 = none)
+TAXONOMY_PREFIXES = list(SPECIALTY_PROCEDURE_TARGETS)
+PROCEDURE_TARGET_RATIOS = np.array([SPECIALTY_PROCEDURE_TARGETS[p] for p in TAXONOMY_PREFIXES])
+PROCEDURE_SPECIALTY_NAMES = np.array([TAXONOMY_TO_SPECIALTY[p] for p in TAXONOMY_PREFIXES], dtype=object)
+TAXONOMY_PREFIX_INDEX = {prefix: i for i, prefix in enumerate(TAXONOMY_PREFIXES)}
+
+# First ';'-separated code (leading whitespace allowed) that starts with a procedure-heavy prefix
+TAXONOMY_PREFIX_RE = re.compile(r'(?:^|;)\s*(' + '|'.join(map(re.escape, TAXONOMY_PREFIXES)) + ')')
+
+def taxonomy_prefix_index(taxonomy_str):
+    """Index into TAXONOMY_PREFIXES for a taxonomy string, or -1 if no code is procedure-heavy."""
+    if _isna(taxonomy_str):
+        return -1
+    match = TAXONOMY_PREFIX_RE.search(str(taxonomy_str))
+    return TAXONOMY_PREFIX_INDEX[match.group(1)] if match else -1
+
+def taxonomy_prefix_index_vec(taxonomy):
+    """
+    Vectorized taxonomy_prefix_index over a taxonomy Series. Taxonomy strings
+    repeat heavily, so the regex runs once per distinct value and the indices
+    are taken back per row (missing taxonomies map to -1).
+    """
+    codes, uniques = pd.factorize(taxonomy)
+    prefix = pd.Series(uniques, dtype=object).astype(str).str.extract(TAXONOMY_PREFIX_RE, expand=False)
+    index = prefix.map(TAXONOMY_PREFIX_INDEX).fillna(-1).to_numpy(dtype=np.int8)
+    return np.append(index, np.int8(-1))[codes]
+
 def get_specialty_name(taxonomy_str):
     """Return human-readable specialty name from taxonomy code."""
-    if pd.isna(taxonomy_str) or taxonomy_str == "":
+    if _isna(taxonomy_str) or taxonomy_str == "":
         return "Unknown"
 
-    codes = [c.strip() for c in str(taxonomy_str).split(';') if c.strip()]
-    for code in codes:
-        for prefix, specialty in TAXONOMY_TO_SPECIALTY.items():
-            if code.startswith(prefix):
-                return specialty
-    return "Other Specialty"
+    idx = taxonomy_prefix_index(taxonomy_str)
+    return PROCEDURE_SPECIALTY_NAMES[idx] if idx >= 0 else "Other Specialty"
 
 def get_expected_procedure_ratio(taxonomy_str):
     """
     Given a taxonomy string, return the expected procedure ratio if it matches
     a procedure-heavy specialty. Returns None if no match.
     """
-    if pd.isna(taxonomy_str) or taxonomy_str == "":
-        return None
-
-    # Check each taxonomy code in the string (may have multiple separated by ;)
-    codes = [c.strip() for c in str(taxonomy_str).split(';') if c.strip()]
-
-    for code in codes:
-        # Check for exact matches or prefix matches
-        for taxonomy_prefix, expected_ratio in SPECIALTY_PROCEDURE_TARGETS.items():
-            if code.startswith(taxonomy_prefix):
-                return expected_ratio
-
-    return None
+    idx = taxonomy_prefix_index(taxonomy_str)
+    return PROCEDURE_TARGET_RATIOS[idx] if idx >= 0 else None
 
 def score_procedure_alignment(row):
     """
@@ -111,59 +230,50 @@ def score_procedure_alignment(row):
     - Flags if procedures are significantly below expected
 
     Data Quality Tracking:
-    - Tracks when procedure-heavy specialties are missing procedure data
-    - Uses global counter PROCEDURE_DATA_QUALITY_STATS
+    - Tracked separately by procedure_data_status_vec / tally_procedure_data_quality
+      so this function stays free of global state
+
+    score_procedure_alignment_vec is the whole-frame equivalent.
     """
     segment = str(row.get('segment_label', ''))
 
     # Only apply to relevant segments
-    if segment not in ['Private Practice', 'Specialty Group']:
+    if segment not in PROCEDURE_SEGMENTS:
         return 0, ""
 
     # Get expected procedure ratio based on taxonomy
-    taxonomy = row.get('taxonomy', '')
-    expected_ratio = get_expected_procedure_ratio(taxonomy)
+    tax_idx = taxonomy_prefix_index(row.get('taxonomy', ''))
 
-    if expected_ratio is None:
+    if tax_idx < 0:
         # Not a procedure-heavy specialty
         return 0, ""
-
-    # DATA QUALITY TRACKING: This is a procedure-heavy specialty
-    global PROCEDURE_DATA_QUALITY_STATS
-    specialty_name = get_specialty_name(taxonomy)
-    PROCEDURE_DATA_QUALITY_STATS['procedure_heavy_specialties'] += 1
-    PROCEDURE_DATA_QUALITY_STATS['by_specialty'][specialty_name] = PROCEDURE_DATA_QUALITY_STATS['by_specialty'].get(specialty_name, 0) + 1
+    expected_ratio = PROCEDURE_TARGET_RATIOS[tax_idx]
 
     # Get actual procedure data
     procedure_ratio = row.get('procedure_ratio', 0)
     original_procedure_ratio = row.get('procedure_ratio', None)
 
-    if pd.isna(procedure_ratio):
+    if _isna(procedure_ratio):
         procedure_ratio = 0
 
     total_procedure_codes = row.get('total_procedure_codes', 0)
-    if pd.isna(total_procedure_codes):
+    if _isna(total_procedure_codes):
         total_procedure_codes = 0
 
     total_eval_codes = row.get('total_eval_codes', 0)
-    if pd.isna(total_eval_codes):
+    if _isna(total_eval_codes):
         total_eval_codes = 0
 
     # Need meaningful volume to assess (at least 50 total claims)
     total_claims = total_procedure_codes + total_eval_codes
     if total_claims < 50:
         # DATA QUALITY: Low volume, can't assess
-        PROCEDURE_DATA_QUALITY_STATS['low_volume'] += 1
         return 0, ""
 
     # DATA QUALITY CHECK: Missing procedure data for procedure-heavy specialty
-    if pd.isna(original_procedure_ratio):
-        PROCEDURE_DATA_QUALITY_STATS['missing_data'] += 1
-        PROCEDURE_DATA_QUALITY_STATS['missing_by_specialty'][specialty_name] = PROCEDURE_DATA_QUALITY_STATS['missing_by_specialty'].get(specialty_name, 0) + 1
+    if _isna(original_procedure_ratio):
         # Silently return 0 (conservative approach)
         return 0, ""
-    else:
-        PROCEDURE_DATA_QUALITY_STATS['has_data'] += 1
 
     # Calculate deficit
     deficit = expected_ratio - procedure_ratio
@@ -179,13 +289,79 @@ def score_procedure_alignment(row):
             reason = f"Severe procedure deficit: {procedure_ratio:.1%} vs expected {expected_ratio:.1%}"
         else:
             pain_score = 4 + ((deficit - PROCEDURE_DEFICIT_THRESHOLD) / 0.20) * 6
-            pain_score = round(pain_score, 1)
+            pain_score = _round(pain_score, 1)
             reason = f"Procedure deficit: {procedure_ratio:.1%} vs expected {expected_ratio:.1%}"
 
         return pain_score, reason
 
     return 0, ""
 
+def score_procedure_alignment_vec(df, status, tax_idx):
+    """
+    Vectorized score_procedure_alignment over clinics whose audit status is
+    PROCEDURE_STATUS_HAS_DATA (see procedure_data_status_vec).
+
+    Returns: (scores, reasons) arrays aligned with df.
+    """
+    expected_ratio = PROCEDURE_TARGET_RATIOS[tax_idx]
+    procedure_ratio = _float_column(df, 'procedure_ratio', np.nan)
+    deficit = expected_ratio - procedure_ratio
+
+    flagged = (status == PROCEDURE_STATUS_HAS_DATA) & (deficit >= PROCEDURE_DEFICIT_THRESHOLD)
+    severe = flagged & (deficit >= 0.40)
+    with np.errstate(invalid='ignore'):
+        moderate_score = round_vec(4 + ((deficit - PROCEDURE_DEFICIT_THRESHOLD) / 0.20) * 6, 1)
+    scores = np.select([~flagged, severe], [0.0, 10.0], default=moderate_score)
+
+    reasons = np.where(
+        severe,
+        _format_vec("Severe procedure deficit: %.1f%% vs expected %.1f%%", procedure_ratio * 100, expected_ratio * 100, where=severe),
+        _format_vec("Procedure deficit: %.1f%% vs expected %.1f%%", procedure_ratio * 100, expected_ratio * 100, where=flagged & ~severe),
+    )
+    return scores, reasons
+
+def procedure_data_status_vec(df, track, tax_idx):
+    """
+    Vectorized data-quality status of the procedure alignment audit, mirroring
+    the early returns in score_procedure_alignment (AMBULATORY track only).
+
+    Returns: int8 array of PROCEDURE_STATUS_* codes
+    """
+    segment = df['segment_label'] if 'segment_label' in df.columns else pd.Series('', index=df.index)
+    audited = (np.asarray(track) == 'AMBULATORY') & segment.isin(PROCEDURE_SEGMENTS).to_numpy() & (tax_idx >= 0)
+
+    total_procedure_codes = _float_column(df, 'total_procedure_codes', 0)
+    total_eval_codes = _float_column(df, 'total_eval_codes', 0)
+    total_claims = np.where(np.isnan(total_procedure_codes), 0, total_procedure_codes) + np.where(np.isnan(total_eval_codes), 0, total_eval_codes)
+    procedure_ratio = _float_column(df, 'procedure_ratio', np.nan)
+
+    return np.select(
+        [~audited, total_claims < 50, np.isnan(procedure_ratio)],
+        [PROCEDURE_STATUS_NA, PROCEDURE_STATUS_LOW_VOLUME, PROCEDURE_STATUS_MISSING],
+        default=PROCEDURE_STATUS_HAS_DATA,
+    ).astype(np.int8)
+
+def tally_procedure_data_quality(status, tax_idx):
+    """
+    Fill PROCEDURE_DATA_QUALITY_STATS from per-clinic statuses after scoring,
+    via one specialty x status count table (bincount, then grouped by name).
+    """
+    audited = status != PROCEDURE_STATUS_NA
+    n_status = PROCEDURE_STATUS_LOW_VOLUME + 1
+    cells = tax_idx[audited].astype(np.intp) * n_status + status[audited]
+    counts = np.bincount(cells, minlength=len(TAXONOMY_PREFIXES) * n_status).reshape(-1, n_status)
+    table = pd.DataFrame(counts, index=PROCEDURE_SPECIALTY_NAMES).groupby(level=0).sum()
+    by_specialty = table.sum(axis=1)
+    missing_by_specialty = table[PROCEDURE_STATUS_MISSING]
+    PROCEDURE_DATA_QUALITY_STATS.update({
+        'procedure_heavy_specialties': int(by_specialty.sum()),
+        'has_data': int(table[PROCEDURE_STATUS_HAS_DATA].sum()),
+        'missing_data': int(missing_by_specialty.sum()),
+        'low_volume': int(table[PROCEDURE_STATUS_LOW_VOLUME].sum()),
+        'by_specialty': {name: int(count) for name, count in by_specialty.items() if count > 0},
+        'missing_by_specialty': {name: int(count) for name, count in missing_by_specialty.items() if count > 0},
+    })
+
 def detect_track(row):
     """
     Determine which scoring track to use based on the new descriptive segment labels.
@@ -196,8 +372,7 @@ def detect_track(row):
     if segment == 'Behavioral Health':
         return 'BEHAVIORAL'
 
-    behavioral_keywords = ['BEHAVIORAL', 'PSYCH', 'MENTAL HEALTH', 'COUNSELING', 'THERAPY']
-    if any(keyword in org_name for keyword in behavioral_keywords):
+    if any(keyword in org_name for keyword in BEHAVIORAL_KEYWORDS):
         return 'BEHAVIORAL'
 
     if segment in ['Home Health', 'Hospital']:
@@ -205,8 +380,23 @@ def detect_track(row):
 
     return 'AMBULATORY'
 
+def detect_track_vec(df):
+    """Vectorized detect_track over every clinic; returns a categorical Series."""
+    segment = df['segment_label'] if 'segment_label' in df.columns else pd.Series('', index=df.index)
+    if 'org_name' in df.columns:
+        is_behavioral_name = df['org_name'].astype(str).str.upper().str.contains(BEHAVIORAL_NAME_RE, na=False)
+    else:
+        is_behavioral_name = pd.Series(False, index=df.index)
+
+    track = np.select(
+        [(segment == 'Behavioral Health') | is_behavioral_name, segment.isin(['Home Health', 'Hospital'])],
+        ['BEHAVIORAL', 'POST_ACUTE'],
+        default='AMBULATORY',
+    )
+    return pd.Categorical(track, dtype=TRACK_DTYPE)
+
 def score_undercoding_continuous(ratio):
-    if ratio <= 0 or pd.isna(ratio):
+    if ratio <= 0 or _isna(ratio):
         return 10, "No undercoding data available"
     if ratio >= UNDERCODING_NATIONAL_AVG:
         # WINNING: Above national average means strong E&M documentation
@@ -214,10 +404,38 @@ def score_undercoding_continuous(ratio):
     if ratio <= UNDERCODING_SEVERE:
         return 40, f"Severe undercoding ({ratio:.3f})"
     score = 40 - ((ratio - UNDERCODING_SEVERE) / (UNDERCODING_NATIONAL_AVG - UNDERCODING_SEVERE)) * 25
-    return round(score, 1), f"Undercoding ratio {ratio:.3f}"
+    return _round(score, 1), f"Undercoding ratio {ratio:.3f}"
+
+def score_undercoding_vec(ratio):
+    """
+    Vectorized score_undercoding_continuous over an array of ratios.
+
+    Returns: (scores, reasons) arrays aligned with `ratio`.
+    """
+    ratio = np.asarray(ratio, dtype=float)
+    no_data = ~(ratio > 0)  # <= 0 or NaN
+    strong = ratio >= UNDERCODING_NATIONAL_AVG
+    severe = ratio <= UNDERCODING_SEVERE
+    with np.errstate(invalid='ignore'):
+        linear = 40 - ((ratio - UNDERCODING_SEVERE) / (UNDERCODING_NATIONAL_AVG - UNDERCODING_SEVERE)) * 25
+    scores = np.select([no_data, strong, severe], [10.0, 0.0, 40.0], default=round_vec(linear, 1))
+
+    # Each reason is formatted only on the rows whose branch np.select picks
+    conditions = [no_data, strong, severe]
+    picked = np.select(conditions, np.arange(len(conditions)), default=len(conditions))
+    reasons = np.select(
+        conditions,
+        [
+            "No undercoding data available",
+            _format_vec("Strong E&M documentation (%.3f)", ratio, where=picked == 1),
+            _format_vec("Severe undercoding (%.3f)", ratio, where=picked == 2),
+        ],
+        default=_format_vec("Undercoding ratio %.3f", ratio, where=picked == 3),
+    )
+    return scores, reasons
 
 def score_psych_risk_continuous(ratio):
-    if ratio <= 0 or pd.isna(ratio):
+    if ratio <= 0 or _isna(ratio):
         return 10, "No psych risk data available"
 
     BENCHMARK = 0.50
@@ -235,30 +453,64 @@ def score_psych_risk_continuous(ratio):
     elif ratio < SWEET_SPOT_LOW:
         deviation = (SWEET_SPOT_LOW - ratio) / (SWEET_SPOT_LOW - SEVERE_LOW)
         score = 10 + (deviation * 30)
-        return round(score, 1), f"Moderate therapy undercoding ({ratio:.3f})"
+        return _round(score, 1), f"Moderate therapy undercoding ({ratio:.3f})"
     else:
         deviation = (ratio - SWEET_SPOT_HIGH) / (SEVERE_HIGH - SWEET_SPOT_HIGH)
         score = 10 + (deviation * 30)
-        return round(score, 1), f"Elevated psych audit risk ({ratio:.3f})"
+        return _round(score, 1), f"Elevated psych audit risk ({ratio:.3f})"
+
+def score_psych_risk_vec(ratio):
+    """
+    Vectorized score_psych_risk_continuous over an array of ratios.
+
+    Returns: (scores, reasons) arrays aligned with `ratio`.
+    """
+    ratio = np.asarray(ratio, dtype=float)
+    no_data = ~(ratio > 0)  # <= 0 or NaN
+    severe_low = ratio <= 0.30
+    severe_high = ratio >= 0.75
+    balanced = (ratio >= 0.40) & (ratio <= 0.60)
+    under = ratio < 0.40
+    conditions = [no_data, severe_low, severe_high, balanced, under]
+
+    with np.errstate(invalid='ignore'):
+        under_score = round_vec(10 + ((0.40 - ratio) / (0.40 - 0.30)) * 30, 1)
+        over_score = round_vec(10 + ((ratio - 0.60) / (0.75 - 0.60)) * 30, 1)
+    scores = np.select(conditions, [10.0, 40.0, 40.0, 10.0, under_score], default=over_score)
+
+    # Each reason is formatted only on the rows whose branch np.select picks
+    picked = np.select(conditions, np.arange(len(conditions)), default=len(conditions))
+    reasons = np.select(
+        conditions,
+        [
+            "No psych risk data available",
+            _format_vec("Severe therapy undercoding (%.3f) - Revenue Leakage", ratio, where=picked == 1),
+            _format_vec("Severe psych audit risk (%.3f) - Compliance Threat", ratio, where=picked == 2),
+            _format_vec("Balanced therapy coding (%.3f) - Appropriate", ratio, where=picked == 3),
+            _format_vec("Moderate therapy undercoding (%.3f)", ratio, where=picked == 4),
+        ],
+        default=_format_vec("Elevated psych audit risk (%.3f)", ratio, where=picked == 5),
+    )
+    return scores, reasons
 
 def score_behavioral_vbc_readiness(row):
     score = 0
     reasoning = []
     avg_mips = row.get('avg_mips_score', None)
-    if pd.notna(avg_mips) and avg_mips > 80:
+    if not _isna(avg_mips) and avg_mips > 80:
         score += 5
         reasoning.append(f"MIPS {avg_mips:.1f} = VBC-ready tech infrastructure")
-    elif pd.notna(avg_mips) and avg_mips >= 60:
+    elif not _isna(avg_mips) and avg_mips >= 60:
         score += 3
         reasoning.append(f"MIPS {avg_mips:.1f} = moderate tech readiness")
     
-    is_aco = str(row.get('is_aco_participant', '')).lower() == 'true'
+    is_aco = _is_true(row.get('is_aco_participant', ''))
     if is_aco:
         score += 5
         reasoning.append("ACO participant = VBC experience")
     
-    is_hpsa = str(row.get('is_hpsa', 'False')).lower() == 'true'
-    is_mua = str(row.get('is_mua', 'False')).lower() == 'true'
+    is_hpsa = _is_true(row.get('is_hpsa', 'False'))
+    is_mua = _is_true(row.get('is_mua', 'False'))
     if is_hpsa or is_mua:
         score += 5
         designation = []
@@ -274,10 +526,17 @@ def score_provider_count_continuous(npi_count):
     if npi_count >= 100:
         return 10
     score = (math.log(npi_count) / math.log(100)) * 10
-    return round(score, 1)
+    return _round(score, 1)
+
+def score_provider_count_vec(npi_count):
+    """Vectorized score_provider_count_continuous over an array of provider counts."""
+    npi_count = np.asarray(npi_count, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scaled = round_vec((np.log(npi_count) / np.log(100)) * 10, 1)
+    return np.select([npi_count <= 1, npi_count >= 100], [0.0, 10.0], default=scaled)
 
 def score_revenue_continuous(revenue, segment):
-    if pd.isna(revenue) or revenue <= 0:
+    if _isna(revenue) or revenue <= 0:
         return 2
     is_fqhc = segment == 'FQHC'
     if is_fqhc:
@@ -292,10 +551,25 @@ def score_revenue_continuous(revenue, segment):
     log_min = math.log(min_rev)
     log_max = math.log(max_rev)
     score = 2 + ((log_revenue - log_min) / (log_max - log_min)) * 13
-    return round(min(15, max(2, score)), 1)
+    return _round(min(15, max(2, score)), 1)
+
+def score_behavioral_revenue_continuous(revenue):
+    # EQUALIZED THRESHOLDS: Use same revenue scale as AMBULATORY track
+    # Old: $250k-$5M, New: $1M-$15M (matches deal size economics)
+    if _isna(revenue) or revenue <= 0:
+        return 2
+    if revenue >= 15_000_000:
+        return 15
+    if revenue <= 1_000_000:
+        return 2
+    log_revenue = math.log(revenue)
+    log_min = math.log(1_000_000)
+    log_max = math.log(15_000_000)
+    score = 2 + ((log_revenue - log_min) / (log_max - log_min)) * 13
+    return _round(min(15, max(2, score)), 1)
 
 def score_volume_continuous(volume, is_verified):
-    if pd.isna(volume) or volume <= 0:
+    if _isna(volume) or volume <= 0:
         return 3
     max_score = 15 if is_verified else 10
     if volume >= 50_000:
@@ -306,10 +580,10 @@ def score_volume_continuous(volume, is_verified):
     log_min = math.log(1_000)
     log_max = math.log(50_000)
     score = 3 + ((log_volume - log_min) / (log_max - log_min)) * (max_score - 3)
-    return round(min(max_score, max(3, score)), 1)
+    return _round(min(max_score, max(3, score)), 1)
 
 def score_behavioral_volume_continuous(volume, is_verified):
-    if pd.isna(volume) or volume <= 0:
+    if _isna(volume) or volume <= 0:
         return 3
     max_score = 15 if is_verified else 10
     if volume >= 20_000:
@@ -320,36 +594,236 @@ def score_behavioral_volume_continuous(volume, is_verified):
     log_min = math.log(500)
     log_max = math.log(20_000)
     score = 3 + ((log_volume - log_min) / (log_max - log_min)) * (max_score - 3)
-    return round(min(max_score, max(3, score)), 1)
+    return _round(min(max_score, max(3, score)), 1)
+
+def therapy_gates(total_psych_codes, total_eval_codes, psych_risk):
+    """
+    Therapy relevance gate: therapy pain only counts when >20% of ambulatory
+    volume is therapy, with at least 100 psych codes and a psych risk signal.
+
+    Returns: (gate, driver_gate). The pain/label gate needs eval codes for a
+    valid percentage; the driver gate uses the raw share.
+    """
+    eval_codes_available = not _isna(total_eval_codes) and total_eval_codes > 0
+    if _isna(total_eval_codes): total_eval_codes = 0
+
+    total_ambulatory_claims = total_psych_codes + total_eval_codes
+    psych_share = total_psych_codes / total_ambulatory_claims if total_ambulatory_claims > 0 else 0
+
+    # EDGE CASE: If eval_codes is missing, we can't calculate a valid percentage
+    # Conservative approach: set percentage to 0 (won't pass gate)
+    psych_percentage = psych_share if eval_codes_available else 0
+
+    has_therapy_volume = total_psych_codes >= 100 and psych_risk > 0
+    return psych_percentage > 0.20 and has_therapy_volume, psych_share > 0.20 and has_therapy_volume
+
+def therapy_gates_vec(df):
+    """Vectorized therapy_gates over the whole frame."""
+    psych = _float_column(df, 'total_psych_codes', 0)
+    psych = np.where(np.isnan(psych), 0, psych)
+    eval_codes = _float_column(df, 'total_eval_codes', 0)
+    psych_risk = _float_column(df, 'psych_risk_ratio', 0)
+
+    total_ambulatory_claims = psych + np.where(np.isnan(eval_codes), 0, eval_codes)
+    has_claims = total_ambulatory_claims > 0
+    psych_share = np.where(has_claims, psych / np.where(has_claims, total_ambulatory_claims, 1), 0)
+
+    has_therapy_volume = (psych >= 100) & (psych_risk > 0)
+    driver_gate = (psych_share > 0.20) & has_therapy_volume
+    return driver_gate & (eval_codes > 0), driver_gate
+
+def _flag_column(df, column):
+    """Vectorized _is_true over a column; False everywhere when the input lacks it."""
+    if column in df.columns:
+        return df[column].astype(str).str.lower().eq('true').to_numpy(dtype=bool)
+    return np.zeros(len(df), dtype=bool)
+
+def _float_column(df, column, default):
+    """Column as a float array, or `default` everywhere when the input lacks it."""
+    if column in df.columns:
+        return df[column].to_numpy(dtype=float)
+    return np.full(len(df), default, dtype=float)
+
+def score_all_continuous(df):
+    """
+    Run the vectorized continuous scorers over every clinic at once.
+
+    Returns a dict of per-clinic arrays (sub-scores, flags, track) for score_dataframe.
+    """
+    pain_undercoding, reason_undercoding = score_undercoding_vec(_float_column(df, 'undercoding_ratio', 0))
+    pain_psych, reason_psych = score_psych_risk_vec(_float_column(df, 'psych_risk_ratio', 0))
+    track = detect_track_vec(df)
+
+    # Revenue falls back through the same sources, in the same order, as calculate_row_score
+    real_revenue = _float_column(df, 'total_revenue', np.nan)
+    for column in ['hospital_total_revenue', 'fqhc_revenue', 'hha_revenue', 'real_medicare_revenue']:
+        real_revenue = np.where(np.isnan(real_revenue), _float_column(df, column, np.nan), real_revenue)
+    real_enc = _float_column(df, 'services_count', np.nan)
+    est_enc = _float_column(df, 'final_volume', np.nan)
+    vol_metric = np.where(real_enc > 0, real_enc, np.where(np.isnan(est_enc), 0.0, est_enc))
+
+    if 'volume_source' in df.columns:
+        is_verified = df['volume_source'].astype(str).str.upper().str.contains(VERIFIED_VOLUME_RE, na=False).to_numpy(dtype=bool)
+    else:
+        is_verified = np.zeros(len(df), dtype=bool)
+    is_fqhc = (df['segment_label'] == 'FQHC').to_numpy() if 'segment_label' in df.columns else np.zeros(len(df), dtype=bool)
+    is_behavioral = np.asarray(track) == 'BEHAVIORAL'
+
+    multiplier = np.select([is_behavioral, is_fqhc], [150, 300], default=100)
+    est_rev = np.where(np.isnan(real_revenue), vol_metric * multiplier, real_revenue)
+    s3_revenue = np.where(is_behavioral, _log_scaled_vec(est_rev, 1_000_000, 15_000_000, 2, 15), score_revenue_vec(est_rev, is_fqhc))
+    s3_volume = np.where(is_behavioral, score_volume_vec(vol_metric, is_verified, 500, 20_000), score_volume_vec(vol_metric, is_verified))
+    therapy_gate, therapy_driver_gate = therapy_gates_vec(df)
+    tax_idx = taxonomy_prefix_index_vec(df['taxonomy']) if 'taxonomy' in df.columns else np.full(len(df), -1, dtype=np.int8)
+
+    return {
+        '_real_revenue': real_revenue,
+        '_est_rev': est_rev,
+        '_vol_metric': vol_metric,
+        '_pain_undercoding': pain_undercoding,
+        '_reason_undercoding': reason_undercoding,
+        '_pain_psych': pain_psych,
+        '_reason_psych': reason_psych,
+        '_s2_complex': score_provider_count_vec(_float_column(df, 'npi_count', 1)),
+        '_track': track,
+        '_s3_revenue': s3_revenue,
+        '_s3_volume': s3_volume,
+        '_tax_idx': tax_idx,
+        '_procedure_status': procedure_data_status_vec(df, track, tax_idx),
+        '_therapy_gate': therapy_gate,
+        '_therapy_driver_gate': therapy_driver_gate,
+        '_is_verified': is_verified,
+        '_is_aco': _flag_column(df, 'is_aco_participant'),
+        '_is_hpsa': _flag_column(df, 'is_hpsa'),
+        '_is_mua': _flag_column(df, 'is_mua'),
+        '_is_risk': _flag_column(df, 'risk_compliance_flag') | _flag_column(df, 'oig_leie_flag'),
+    }
+
+def _distinct_rows(columns):
+    """
+    Factorize row tuples across `columns`: returns (codes, rep) where rep[code]
+    is one row holding that tuple. Floats are keyed on their bit pattern so
+    -0.0 and NaN payloads stay distinct, exactly as %-formatting sees them.
+    """
+    key = None
+    for column in columns:
+        if column.dtype.kind == 'f':
+            column = column.astype(np.float64).view(np.int64)
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        key = codes if key is None else pd.factorize(key * len(uniques) + codes)[0]
+    rep = np.empty(key.max() + 1 if len(key) else 0, dtype=np.int64)
+    rep[key] = np.arange(len(key))
+    return key, rep
+
+def _format_vec(template, *columns, where=None):
+    """
+    %-format `template` row-wise into an object array that concatenates with
+    plain strs. Rows outside `where` are left as '' and never formatted; each
+    distinct value is formatted once and taken into every row that holds it.
+    """
+    if where is None:
+        where = np.ones(len(columns[0]), dtype=bool)
+    formatted = np.full(len(where), '', dtype=object)
+    rows = np.flatnonzero(where)
+    values = [np.asarray(column)[rows] for column in columns]
+    codes, rep = _distinct_rows(values)
+    if len(values) == 1:
+        table = [template % value for value in values[0][rep].tolist()]
+    else:
+        table = [template % row for row in zip(*(column[rep].tolist() for column in values))]
+    formatted[rows] = np.array(table, dtype=object)[codes]
+    return formatted
+
+def _category_codes(conditions, labels, default, dtype):
+    """np.select over the category codes of `dtype` (first matching condition's label, else `default`)."""
+    codes = [dtype.categories.get_loc(label) for label in labels]
+    return np.select(conditions, codes, default=dtype.categories.get_loc(default)).astype(np.int8)
+
+def _join_vec(parts, sep=' | '):
+    """Row-wise sep.join over object arrays of strings, skipping the '' entries."""
+    joined = np.array(parts[0], dtype=object)
+    for part in parts[1:]:
+        rows = np.flatnonzero(part != '')
+        head = joined[rows]
+        joined[rows] = np.where(head != '', head + sep + part[rows], part[rows])
+    return joined
+
+def format_strategy_reasoning_vec(track, s3_revenue, s3_volume, est_rev, vol_metric, is_verified):
+    """
+    Vectorized score_reasoning_strategy: the same strings calculate_row_score
+    formats per row, built column-wise for every tier (the UI shows them all).
+    """
+    is_behavioral = np.asarray(track) == 'BEHAVIORAL'
+    has_volume = vol_metric > 0
+
+    revenue = '+' + _format_vec('%.1f', s3_revenue) + 'pts: $' + _format_vec('%.2f', est_rev / 1_000_000) + 'M revenue'
+    revenue = np.where(is_behavioral, revenue + ' (equalized thresholds)', revenue)
+
+    volume_count = pd.Series(np.where(has_volume, vol_metric, 0).astype(np.int64)).map('{:,}'.format).to_numpy(dtype=object)
+    volume = volume_count + np.where(is_verified, ' verified volume', ' estimated volume').astype(object)
+    volume = np.where(is_behavioral, volume + ' (behavioral thresholds)', volume)
+    volume = np.where(has_volume, volume, 'No volume data')
+
+    return revenue + ' | +' + _format_vec('%.1f', s3_volume) + 'pts: ' + volume
+
+def _log_scaled_vec(value, low, high, floor, ceiling):
+    """
+    Vectorized log-scale rescaling shared by the revenue and volume scorers:
+    `floor` at or below `low` (or missing), `ceiling` at or above `high`.
+    """
+    value = np.asarray(value, dtype=float)
+    log_low, log_high = math.log(low), math.log(high)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scaled = floor + ((np.log(value) - log_low) / (log_high - log_low)) * (ceiling - floor)
+    scaled = round_vec(np.minimum(ceiling, np.maximum(floor, scaled)), 1)
+    return np.select([~(value > 0), value >= high, value <= low], [floor, ceiling, floor], default=scaled).astype(float)
+
+def score_revenue_vec(revenue, is_fqhc):
+    """Vectorized score_revenue_continuous; `is_fqhc` selects the FQHC revenue band per row."""
+    return np.where(is_fqhc, _log_scaled_vec(revenue, 100_000, 5_000_000, 2, 15), _log_scaled_vec(revenue, 500_000, 15_000_000, 2, 15))
+
+def score_volume_vec(volume, is_verified, low=1_000, high=50_000):
+    """Vectorized score_volume_continuous (pass low=500, high=20_000 for the behavioral scale)."""
+    return np.where(is_verified, _log_scaled_vec(volume, low, high, 3, 15), _log_scaled_vec(volume, low, high, 3, 10))
 
 def calculate_row_score(row):
+    """Score one clinic; `row` is any mapping with `.get` (a dict or a DataFrame row)."""
     real_revenue = row.get('total_revenue')
-    if pd.isna(real_revenue): real_revenue = row.get('hospital_total_revenue')
-    if pd.isna(real_revenue): real_revenue = row.get('fqhc_revenue')
-    if pd.isna(real_revenue): real_revenue = row.get('hha_revenue')
-    if pd.isna(real_revenue): real_revenue = row.get('real_medicare_revenue')
+    if _isna(real_revenue): real_revenue = row.get('hospital_total_revenue')
+    if _isna(real_revenue): real_revenue = row.get('fqhc_revenue')
+    if _isna(real_revenue): real_revenue = row.get('hha_revenue')
+    if _isna(real_revenue): real_revenue = row.get('real_medicare_revenue')
 
     real_enc = row.get('services_count')
     est_enc = row.get('final_volume')
-    vol_metric = real_enc if (pd.notnull(real_enc) and real_enc > 0) else (est_enc if pd.notnull(est_enc) else 0)
+    vol_metric = real_enc if (not _isna(real_enc) and real_enc > 0) else (est_enc if not _isna(est_enc) else 0)
 
-    volume_source = str(row.get('volume_source', '')).upper()
-    is_verified_volume = 'UDS' in volume_source or 'VERIFIED' in volume_source or 'CLAIMS' in volume_source or 'HRSA' in volume_source
+    is_verified_volume = VERIFIED_VOLUME_RE.search(str(row.get('volume_source', '')).upper()) is not None
 
     undercoding = row.get('undercoding_ratio', 0)
-    if pd.isna(undercoding): undercoding = 0
+    if _isna(undercoding): undercoding = 0
     psych_risk = row.get('psych_risk_ratio', 0)
-    if pd.isna(psych_risk): psych_risk = 0
+    if _isna(psych_risk): psych_risk = 0
+
+    pain_undercoding, reason_undercoding = score_undercoding_continuous(undercoding)
+    pain_psych, reason_psych = score_psych_risk_continuous(psych_risk)
+
+    total_psych_codes = row.get('total_psych_codes', 0)
+    if _isna(total_psych_codes): total_psych_codes = 0
 
-    is_aco = str(row.get('is_aco_participant', '')).lower() == 'true'
-    is_risk = str(row.get('risk_compliance_flag', '')).lower() == 'true' or str(row.get('oig_leie_flag', '')).lower() == 'true'
+    # Therapy relevance gate, evaluated once for the pain, driver and label blocks
+    therapy_gate, therapy_driver_gate = therapy_gates(total_psych_codes, row.get('total_eval_codes', 0), psych_risk)
+
+    is_aco = _is_true(row.get('is_aco_participant', ''))
+    is_risk = _is_true(row.get('risk_compliance_flag', '')) or _is_true(row.get('oig_leie_flag', ''))
     npi_count = float(row.get('npi_count', 1))
     site_count = float(row.get('site_count', 1))
+    s2_complex = score_provider_count_continuous(npi_count)
 
     segment = str(row.get('segment_label', 'Multi-specialty'))
     
     # Revenue-based downgrade for Hospitals
-    if segment == 'Hospital' and pd.notna(real_revenue) and real_revenue < 10_000_000:
+    if segment == 'Hospital' and not _isna(real_revenue) and real_revenue < 10_000_000:
         segment = 'Ambulatory Center'
 
     corrected_fqhc_flag = row.get('fqhc_flag', 0)
@@ -362,25 +836,24 @@ def calculate_row_score(row):
     track = detect_track(row)
 
     if track == 'BEHAVIORAL':
-        pain, reason = score_psych_risk_continuous(psych_risk)
-        pain_reasoning.append(f"+{pain:.1f}pts: {reason}")
-        total_psych = row.get('total_psych_codes', 0)
-        if pd.notna(total_psych) and total_psych > 500:
-            addon_bonus = min(5, (total_psych / 1000) * 5)
+        pain = pain_psych
+        pain_reasoning.append(f"+{pain:.1f}pts: {reason_psych}")
+        if total_psych_codes > 500:
+            addon_bonus = min(5, (total_psych_codes / 1000) * 5)
             pain += addon_bonus
             pain = min(40, pain)
-            pain_reasoning.append(f"+{addon_bonus:.1f}pts: High psych volume ({int(total_psych)} codes) = documentation lift")
+            pain_reasoning.append(f"+{addon_bonus:.1f}pts: High psych volume ({int(total_psych_codes)} codes) = documentation lift")
         if pain >= 20:
             confidence += 40
     elif track == 'POST_ACUTE':
         real_margin = row.get('net_margin')
-        if pd.notna(real_margin):
+        if not _isna(real_margin):
             if real_margin < 0.0:
                 pain = 40
                 pain_reasoning.append(f"+40pts: Negative margin ({real_margin:.1%})")
             elif real_margin < 0.05:
                 pain = 25 + (0.05 - real_margin) / 0.05 * 15
-                pain = round(pain, 1)
+                pain = _round(pain, 1)
                 pain_reasoning.append(f"+{pain:.1f}pts: Low margin ({real_margin:.1%})")
             else:
                 pain = 15
@@ -390,31 +863,10 @@ def calculate_row_score(row):
             pain = 10
             pain_reasoning.append("+10pts: No margin data")
     else:
-        pain_undercoding, reason_undercoding = score_undercoding_continuous(undercoding)
-
         # --- THERAPY RELEVANCE GATE (STRICT PERCENTAGE-BASED) ---
-        total_psych_codes = row.get('total_psych_codes', 0)
-        if pd.isna(total_psych_codes): total_psych_codes = 0
-
-        total_eval_codes = row.get('total_eval_codes', 0)
-        eval_codes_available = pd.notna(total_eval_codes) and total_eval_codes > 0
-        if pd.isna(total_eval_codes): total_eval_codes = 0
-
         pain_therapy = 0
         reason_therapy = ""
 
-        # Calculate therapy as percentage of total ambulatory volume
-        # EDGE CASE: If eval_codes is missing, we can't calculate a valid percentage
-        # Conservative approach: set percentage to 0 (won't pass gate)
-        if not eval_codes_available:
-            psych_percentage = 0
-        else:
-            total_ambulatory_claims = total_psych_codes + total_eval_codes
-            if total_ambulatory_claims > 0:
-                psych_percentage = total_psych_codes / total_ambulatory_claims
-            else:
-                psych_percentage = 0
-
         # STRICT GATE: Therapy must be >20% of ambulatory volume AND >100 absolute codes
         # This prevents large multi-specialty groups with incidental psych billing from being flagged
         # Examples that should NOT be flagged:
@@ -424,9 +876,8 @@ def calculate_row_score(row):
         # Examples that SHOULD be flagged:
         #   - True BH clinic: 800 psych / 1,000 total = 80%
         #   - Integrated BH (FQHC): 300 psych / 1,200 total = 25%
-        if psych_percentage > 0.20 and total_psych_codes >= 100:
-            if pd.notnull(psych_risk) and psych_risk > 0:
-                pain_therapy, reason_therapy = score_psych_risk_continuous(psych_risk)
+        if therapy_gate:
+            pain_therapy, reason_therapy = pain_psych, reason_psych
 
         # --- PROCEDURE ALIGNMENT AUDIT ---
         pain_procedure_alignment, reason_procedure_alignment = score_procedure_alignment(row)
@@ -451,31 +902,19 @@ def calculate_row_score(row):
         if pain >= 30:
             confidence += 50
 
-    s2_align, s2_complex, s2_tech_risk, s2_mips, s2_hpsa_mua = 0, 0, 0, 0, 0
+    s2_align, s2_tech_risk, s2_mips, s2_hpsa_mua = 0, 0, 0, 0
     if track == 'BEHAVIORAL':
         s2_align = 10
         fit_reasoning.append(f"+10pts: Behavioral Health - Core ICP segment")
         vbc_score, vbc_reasons = score_behavioral_vbc_readiness(row)
         for reason in vbc_reasons:
             fit_reasoning.append(reason)
-        s2_complex = score_provider_count_continuous(npi_count)
         if s2_complex > 0:
             fit_reasoning.append(f"+{s2_complex:.1f}pts: {int(npi_count)} providers (operational capacity)")
-        fit = round(s2_align + vbc_score + min(s2_complex, 5), 1)
+        fit = _round(s2_align + vbc_score + min(s2_complex, 5), 1)
     else:
-        segment_alignment_scores = {
-            'FQHC': 15,
-            'Urgent Care': 15,
-            'Behavioral Health': 10,
-            'Private Practice': 10,
-            'Hospital': 8,
-            'Home Health': 5,
-            'Ambulatory Clinic': 5,
-            'Multi-specialty': 5
-        }
-        s2_align = segment_alignment_scores.get(segment, 5)
+        s2_align = SEGMENT_ALIGNMENT_SCORES.get(segment, 5)
         fit_reasoning.append(f"+{s2_align}pts: {segment} alignment")
-        s2_complex = score_provider_count_continuous(npi_count)
         if s2_complex > 0:
             fit_reasoning.append(f"+{s2_complex:.1f}pts: {int(npi_count)} providers")
         if is_aco:
@@ -485,63 +924,50 @@ def calculate_row_score(row):
             s2_tech_risk += 2
             fit_reasoning.append("+2pts: Compliance flag")
         avg_mips_score = row.get('avg_mips_score', None)
-        if pd.notna(avg_mips_score):
+        if not _isna(avg_mips_score):
             if avg_mips_score > 80:
                 s2_mips = 5
                 fit_reasoning.append(f"+5pts: High MIPS quality ({avg_mips_score:.1f})")
             elif avg_mips_score < 50:
                 s2_mips = 5
                 fit_reasoning.append(f"+5pts: Distressed MIPS performer ({avg_mips_score:.1f})")
-        is_hpsa = str(row.get('is_hpsa', 'False')).lower() == 'true'
-        is_mua = str(row.get('is_mua', 'False')).lower() == 'true'
+        is_hpsa = _is_true(row.get('is_hpsa', 'False'))
+        is_mua = _is_true(row.get('is_mua', 'False'))
         if is_hpsa or is_mua:
             s2_hpsa_mua = 5
             designation = []
             if is_hpsa: designation.append("HPSA")
             if is_mua: designation.append("MUA")
             fit_reasoning.append(f"+5pts: {'/'.join(designation)} designated area")
-        fit = round(s2_align + s2_complex + s2_tech_risk + s2_mips + s2_hpsa_mua, 1)
+        fit = _round(s2_align + s2_complex + s2_tech_risk + s2_mips + s2_hpsa_mua, 1)
 
     if track == 'BEHAVIORAL':
-        est_rev = real_revenue if pd.notnull(real_revenue) else (vol_metric * 150)
-        # EQUALIZED THRESHOLDS: Use same revenue scale as AMBULATORY track
-        # Old: $250k-$5M, New: $1M-$15M (matches deal size economics)
-        if pd.isna(est_rev) or est_rev <= 0:
-            s3_revenue = 2
-        elif est_rev >= 15_000_000:
-            s3_revenue = 15
-        elif est_rev <= 1_000_000:
-            s3_revenue = 2
-        else:
-            log_revenue = math.log(est_rev)
-            log_min = math.log(1_000_000)
-            log_max = math.log(15_000_000)
-            s3_revenue = 2 + ((log_revenue - log_min) / (log_max - log_min)) * 13
-            s3_revenue = round(min(15, max(2, s3_revenue)), 1)
-        strategy_reasoning.append(f"+{s3_revenue:.1f}pts: ${est_rev/1_000_000:.2f}M revenue (equalized thresholds)")
+        est_rev = real_revenue if not _isna(real_revenue) else (vol_metric * 150)
+        s3_revenue = score_behavioral_revenue_continuous(est_rev)
         s3_volume = score_behavioral_volume_continuous(vol_metric, is_verified_volume)
+        strategy_reasoning.append(f"+{s3_revenue:.1f}pts: ${est_rev/1_000_000:.2f}M revenue (equalized thresholds)")
         if vol_metric > 0:
             verified_label = "verified" if is_verified_volume else "estimated"
             strategy_reasoning.append(f"+{s3_volume:.1f}pts: {int(vol_metric):,} {verified_label} volume (behavioral thresholds)")
         else:
             strategy_reasoning.append(f"+{s3_volume:.1f}pts: No volume data")
-        strat = round(s3_revenue + s3_volume, 1)
+        strat = _round(s3_revenue + s3_volume, 1)
     else:
         if segment == 'FQHC':
-            est_rev = real_revenue if pd.notnull(real_revenue) else (vol_metric * 300)
+            est_rev = real_revenue if not _isna(real_revenue) else (vol_metric * 300)
         else:
-            est_rev = real_revenue if pd.notnull(real_revenue) else (vol_metric * 100)
+            est_rev = real_revenue if not _isna(real_revenue) else (vol_metric * 100)
         s3_revenue = score_revenue_continuous(est_rev, segment)
-        strategy_reasoning.append(f"+{s3_revenue:.1f}pts: ${est_rev/1_000_000:.2f}M revenue")
         s3_volume = score_volume_continuous(vol_metric, is_verified_volume)
+        strategy_reasoning.append(f"+{s3_revenue:.1f}pts: ${est_rev/1_000_000:.2f}M revenue")
         if vol_metric > 0:
             verified_label = "verified" if is_verified_volume else "estimated"
             strategy_reasoning.append(f"+{s3_volume:.1f}pts: {int(vol_metric):,} {verified_label} volume")
         else:
             strategy_reasoning.append(f"+{s3_volume:.1f}pts: No volume data")
-        strat = round(s3_revenue + s3_volume, 1)
+        strat = _round(s3_revenue + s3_volume, 1)
 
-    total = round(pain + fit + strat, 1)
+    total = _round(pain + fit + strat, 1)
     tier = 'Tier 4'
     if total >= 70: tier = 'Tier 1'
     elif total >= 50: tier = 'Tier 2'
@@ -551,68 +977,59 @@ def calculate_row_score(row):
     if track == 'BEHAVIORAL':
         if pain >= 25:
             if psych_risk <= 0.30:
-                drivers.append(f"💰 Therapy Undercoding ({psych_risk:.2f})")
+                drivers.append(DRIVER_THERAPY_UNDERCODING % psych_risk)
             elif psych_risk >= 0.75:
-                drivers.append(f"🚨 Compliance/Audit Risk ({psych_risk:.2f})")
+                drivers.append(DRIVER_COMPLIANCE_AUDIT_RISK % psych_risk)
             else:
-                drivers.append(f"Therapy Coding Risk ({psych_risk:.2f})")
+                drivers.append(DRIVER_THERAPY_CODING_RISK % psych_risk)
         else:
-            drivers.append(f"{track} Track: Benchmark")
+            drivers.append(DRIVER_BENCHMARK[track])
     elif track == 'POST_ACUTE':
         if pain >= 25:
             real_margin = row.get('net_margin')
-            if pd.notna(real_margin):
+            if not _isna(real_margin):
                 if real_margin < 0:
-                    drivers.append(f"Financial Distress (margin {real_margin:.1%})")
+                    drivers.append(DRIVER_FINANCIAL_DISTRESS % (real_margin * 100))
                 else:
-                    drivers.append(f"Margin Pressure (margin {real_margin:.1%})")
+                    drivers.append(DRIVER_MARGIN_PRESSURE % (real_margin * 100))
             else:
-                drivers.append(f"Margin Pressure")
+                drivers.append("Margin Pressure")
         else:
-            drivers.append(f"{track} Track: Benchmark")
+            drivers.append(DRIVER_BENCHMARK[track])
     else:
         if pain >= 25:
             # Check if procedure alignment is a significant signal
             if pain_procedure_alignment >= 3:
                 procedure_ratio = row.get('procedure_ratio', 0)
-                expected_ratio = get_expected_procedure_ratio(row.get('taxonomy', ''))
+                tax_idx = taxonomy_prefix_index(row.get('taxonomy', ''))
+                expected_ratio = PROCEDURE_TARGET_RATIOS[tax_idx] if tax_idx >= 0 else None
                 if expected_ratio:
-                    drivers.append(f"⚠️ Procedure Alignment ({procedure_ratio:.0%} vs {expected_ratio:.0%} expected)")
-
-            # Calculate therapy percentage for driver logic
-            total_psych_codes_driver = row.get('total_psych_codes', 0)
-            total_eval_codes_driver = row.get('total_eval_codes', 0)
-            if pd.isna(total_psych_codes_driver): total_psych_codes_driver = 0
-            if pd.isna(total_eval_codes_driver): total_eval_codes_driver = 0
-
-            total_ambulatory_driver = total_psych_codes_driver + total_eval_codes_driver
-            psych_pct_driver = total_psych_codes_driver / total_ambulatory_driver if total_ambulatory_driver > 0 else 0
+                    drivers.append(DRIVER_PROCEDURE_ALIGNMENT % (procedure_ratio * 100, expected_ratio * 100))
 
             dominant_signal = "undercoding"
             # STRICT GATE: Only show therapy drivers if >20% of volume is therapy
-            if psych_pct_driver > 0.20 and total_psych_codes_driver >= 100 and pd.notnull(psych_risk) and psych_risk > 0:
-                pain_therapy_check, _ = score_psych_risk_continuous(psych_risk)
-                pain_undercoding_check, _ = score_undercoding_continuous(undercoding)
-                if pain_therapy_check > pain_undercoding_check:
+            # (driver share doesn't require eval codes, unlike the pain/label gate)
+            if therapy_driver_gate:
+                if pain_psych > pain_undercoding:
                     dominant_signal = "therapy"
 
             if dominant_signal == "therapy":
                 if psych_risk <= 0.30:
-                    drivers.append(f"💰 Therapy Undercoding ({psych_risk:.2f})")
+                    drivers.append(DRIVER_THERAPY_UNDERCODING % psych_risk)
                 elif psych_risk >= 0.75:
-                    drivers.append(f"🚨 Therapy Audit Risk ({psych_risk:.2f})")
+                    drivers.append(DRIVER_THERAPY_AUDIT_RISK % psych_risk)
                 else:
-                    drivers.append(f"Therapy Coding Risk ({psych_risk:.2f})")
+                    drivers.append(DRIVER_THERAPY_CODING_RISK % psych_risk)
             else:
                 # Only show undercoding driver if actually undercoding
                 if undercoding >= UNDERCODING_NATIONAL_AVG:
-                    drivers.append(f"✅ Strong E&M Documentation ({undercoding:.2f})")
+                    drivers.append(DRIVER_STRONG_EM % undercoding)
                 elif pain >= 35:
-                    drivers.append(f"🩸 SEVERE Undercoding ({undercoding:.2f})")
+                    drivers.append(DRIVER_SEVERE_UNDERCODING % undercoding)
                 elif undercoding < UNDERCODING_NATIONAL_AVG:
-                    drivers.append(f"E&M Undercoding ({undercoding:.2f})")
+                    drivers.append(DRIVER_EM_UNDERCODING % undercoding)
         else:
-            drivers.append(f"{track} Track: Benchmark")
+            drivers.append(DRIVER_BENCHMARK[track])
 
     if s2_align >= 15:
         if segment == 'FQHC':
@@ -622,18 +1039,14 @@ def calculate_row_score(row):
     elif track == 'BEHAVIORAL':
         drivers.append("Behavioral Health - Core ICP")
 
-    volume_unit = "encounters"
-    if pd.notna(volume_source):
-        if 'UDS' in volume_source.upper() or 'HRSA UDS' in volume_source.upper():
-            volume_unit = "patients"
-        elif 'CLAIMS' in volume_source.upper() or 'MEDICARE' in volume_source.upper():
-            volume_unit = "encounters"
+    # UDS counts patients; claims-based sources count encounters
+    volume_unit = "patients" if 'UDS' in str(row.get('volume_source', '')).upper() else "encounters"
     if s3_volume >= 12:
-        drivers.append(f"High Volume ({int(vol_metric/1000)}k {volume_unit})")
+        drivers.append(DRIVER_HIGH_VOLUME % (int(vol_metric/1000), volume_unit))
     elif site_count > 5:
-        drivers.append(f"Multi-Site Network ({int(site_count)} sites)")
+        drivers.append(DRIVER_MULTI_SITE % int(site_count))
     if est_rev > 5_000_000:
-        drivers.append(f"Strong Rev (${est_rev/1000000:.1f}M)")
+        drivers.append(DRIVER_STRONG_REVENUE % (est_rev/1000000))
     if is_risk:
         drivers.append("Compliance Flag")
     if is_aco:
@@ -642,32 +1055,13 @@ def calculate_row_score(row):
     pain_label = "Economic Pain"
     if track == 'BEHAVIORAL':
         # --- APPLY THERAPY RELEVANCE GATE FOR BEHAVIORAL TRACK ---
-        total_psych_codes_bh = row.get('total_psych_codes', 0)
-        if pd.isna(total_psych_codes_bh): total_psych_codes_bh = 0
-
-        total_eval_codes_bh = row.get('total_eval_codes', 0)
-        eval_codes_available_bh = pd.notna(total_eval_codes_bh) and total_eval_codes_bh > 0
-        if pd.isna(total_eval_codes_bh): total_eval_codes_bh = 0
-
-        # Calculate therapy percentage
-        # EDGE CASE: If eval_codes is missing, we can't calculate a valid percentage
-        if not eval_codes_available_bh:
-            psych_pct_bh = 0
-        else:
-            total_ambulatory_bh = total_psych_codes_bh + total_eval_codes_bh
-            psych_pct_bh = total_psych_codes_bh / total_ambulatory_bh if total_ambulatory_bh > 0 else 0
-
-        # Calculate actual pain scores to determine which is dominant
-        pain_therapy_bh, _ = score_psych_risk_continuous(psych_risk)
-        pain_undercoding_bh, _ = score_undercoding_continuous(undercoding)
-
         # Check if this is a "winner" (strong documentation, no real pain)
-        is_winning_bh = (undercoding >= UNDERCODING_NATIONAL_AVG and pain_therapy_bh == 0)
+        is_winning_bh = (undercoding >= UNDERCODING_NATIONAL_AVG and pain_psych == 0)
 
         if is_winning_bh:
             pain_label = "Low Pain - Strong Documentation"
         # STRICT GATE: Only label as therapy pain if >20% of volume is therapy AND therapy pain > undercoding pain
-        elif psych_pct_bh > 0.20 and total_psych_codes_bh >= 100 and pd.notnull(psych_risk) and psych_risk > 0 and pain_therapy_bh > pain_undercoding_bh:
+        elif therapy_gate and pain_psych > pain_undercoding:
             if psych_risk <= 0.30:
                 pain_label = "Therapy Undercoding Pain"
             elif psych_risk >= 0.75:
@@ -681,37 +1075,16 @@ def calculate_row_score(row):
         pain_label = "Margin Pressure"
     else:  # AMBULATORY
         # --- RE-APPLY RELEVANCE GATE for LABEL ---
-        total_psych_codes = row.get('total_psych_codes', 0)
-        if pd.isna(total_psych_codes): total_psych_codes = 0
-
-        total_eval_codes = row.get('total_eval_codes', 0)
-        eval_codes_available_label = pd.notna(total_eval_codes) and total_eval_codes > 0
-        if pd.isna(total_eval_codes): total_eval_codes = 0
-
-        # Calculate therapy percentage (same logic as above)
-        # EDGE CASE: If eval_codes is missing, we can't calculate a valid percentage
-        if not eval_codes_available_label:
-            psych_percentage = 0
-        else:
-            total_ambulatory_claims = total_psych_codes + total_eval_codes
-            if total_ambulatory_claims > 0:
-                psych_percentage = total_psych_codes / total_ambulatory_claims
-            else:
-                psych_percentage = 0
-
-        pain_therapy_check, _ = score_psych_risk_continuous(psych_risk)
-        pain_undercoding_check, _ = score_undercoding_continuous(undercoding)
-
         # Check if this is a "winner" (strong documentation, no pain)
-        is_winning = (undercoding >= UNDERCODING_NATIONAL_AVG and pain_therapy_check == 0 and pain_procedure_alignment == 0)
+        is_winning = (undercoding >= UNDERCODING_NATIONAL_AVG and pain_psych == 0 and pain_procedure_alignment == 0)
 
         if is_winning:
             pain_label = "Low Pain - Strong Documentation"
         # Check if procedure alignment is the dominant signal
-        elif pain_procedure_alignment >= 3 and pain_procedure_alignment >= pain_therapy_check and pain_procedure_alignment >= pain_undercoding_check:
+        elif pain_procedure_alignment >= 3 and pain_procedure_alignment >= pain_psych and pain_procedure_alignment >= pain_undercoding:
             pain_label = "Procedure Alignment Pain"
         # STRICT GATE: Only label as therapy pain if >20% of volume is therapy
-        elif psych_percentage > 0.20 and total_psych_codes >= 100 and pd.notnull(psych_risk) and psych_risk > 0 and pain_therapy_check > pain_undercoding_check:
+        elif therapy_gate and pain_psych > pain_undercoding:
              if psych_risk <= 0.30: pain_label = "Therapy Undercoding Pain"
              elif psych_risk >= 0.75: pain_label = "Therapy Audit Risk"
              else: pain_label = "Therapy Coding Risk"
@@ -727,16 +1100,16 @@ def calculate_row_score(row):
         'pain_label': pain_label,
         'data_confidence': min(100, confidence),
         'scoring_drivers': " | ".join(drivers) if drivers else "Standard",
-        'score_pain_total': round(pain, 1),
-        'score_pain_signal': round(pain, 1),
+        'score_pain_total': _round(pain, 1),
+        'score_pain_signal': _round(pain, 1),
         'score_pain_volume': 0, 'score_pain_margin': 0, 'score_pain_compliance': 0,
-        'score_fit_total': round(fit, 1),
+        'score_fit_total': _round(fit, 1),
         'score_fit_align': s2_align,
-        'score_fit_complex': round(s2_complex, 1),
+        'score_fit_complex': _round(s2_complex, 1),
         'score_fit_chaos': 0, 'score_fit_risk': s2_tech_risk, 'score_fit_mips': s2_mips, 'score_fit_hpsa_mua': s2_hpsa_mua,
-        'score_strat_total': round(strat, 1),
-        'score_strat_deal': round(s3_revenue, 1),
-        'score_strat_expand': round(s3_volume, 1),
+        'score_strat_total': _round(strat, 1),
+        'score_strat_deal': _round(s3_revenue, 1),
+        'score_strat_expand': _round(s3_volume, 1),
         'score_strat_ref': 0,
         'score_bonus_strategic_scale': 0,
         'score_base_before_bonus': min(100, total),
@@ -748,9 +1121,345 @@ def calculate_row_score(row):
         'score_reasoning_strategy': " | ".join(strategy_reasoning)
     }
 
+def segment_codes_vec(df, real_revenue):
+    """
+    Segment label per clinic after the Hospital revenue downgrade, as
+    (codes, labels) with labels[codes] equal to the segment calculate_row_score
+    uses. The downgrade rewrites codes, so per-segment lookups run once per label.
+    """
+    if 'segment_label' in df.columns:
+        codes, uniques = pd.factorize(df['segment_label'], use_na_sentinel=False)
+        labels = ['nan' if _isna(label) else str(label) for label in uniques]
+    else:
+        codes, labels = np.zeros(len(df), dtype=np.intp), ['Multi-specialty']
+    if 'Hospital' in labels:
+        if 'Ambulatory Center' not in labels:
+            labels.append('Ambulatory Center')
+        # Revenue-based downgrade for Hospitals
+        downgrade = (codes == labels.index('Hospital')) & (real_revenue < 10_000_000)
+        codes = np.where(downgrade, labels.index('Ambulatory Center'), codes)
+    return codes, np.array(labels, dtype=object)
+
+def score_dataframe(df):
+    """
+    Vectorized calculate_row_score over every clinic at once: each branch of
+    the row scorer becomes a mask over whole columns (np.where / np.select),
+    and the reasoning strings are assembled column-wise.
+
+    Also refreshes PROCEDURE_DATA_QUALITY_STATS for the frame.
+
+    Returns: DataFrame of SCORE_COLUMNS aligned with df.index.
+    """
+    n = len(df)
+    parts = score_all_continuous(df)
+    track = np.asarray(parts['_track'], dtype=object)
+    is_behavioral = track == 'BEHAVIORAL'
+    is_post_acute = track == 'POST_ACUTE'
+
+    undercoding = _float_column(df, 'undercoding_ratio', 0)
+    undercoding = np.where(np.isnan(undercoding), 0, undercoding)
+    psych_risk = _float_column(df, 'psych_risk_ratio', 0)
+    psych_risk = np.where(np.isnan(psych_risk), 0, psych_risk)
+    total_psych_codes = _float_column(df, 'total_psych_codes', 0)
+    total_psych_codes = np.where(np.isnan(total_psych_codes), 0, total_psych_codes)
+    pain_undercoding, reason_undercoding = parts['_pain_undercoding'], parts['_reason_undercoding']
+    pain_psych, reason_psych = parts['_pain_psych'], parts['_reason_psych']
+    therapy_gate, therapy_driver_gate = parts['_therapy_gate'], parts['_therapy_driver_gate']
+    is_aco, is_risk = parts['_is_aco'], parts['_is_risk']
+    is_hpsa, is_mua = parts['_is_hpsa'], parts['_is_mua']
+    npi_count = _float_column(df, 'npi_count', 1)
+    site_count = _float_column(df, 'site_count', 1)
+    s2_complex = parts['_s2_complex']
+    real_revenue, est_rev, vol_metric = parts['_real_revenue'], parts['_est_rev'], parts['_vol_metric']
+    s3_revenue, s3_volume = parts['_s3_revenue'], parts['_s3_volume']
+
+    segment_codes, segment_labels = segment_codes_vec(df, real_revenue)
+    segment = segment_labels[segment_codes]
+
+    # --- PAIN: BEHAVIORAL ---
+    high_psych_volume = total_psych_codes > 500
+    addon_bonus = (total_psych_codes / 1000) * 5
+    addon_bonus = np.where(addon_bonus < 5, addon_bonus, 5)
+    behavioral_pain = np.where(high_psych_volume, pain_psych + addon_bonus, pain_psych)
+    behavioral_pain = np.where(high_psych_volume & ~(behavioral_pain < 40), 40, behavioral_pain)
+    behavioral_reasoning = _join_vec([
+        '+' + _format_vec('%.1f', pain_psych) + 'pts: ' + reason_psych,
+        _format_vec("+%.1fpts: High psych volume (%d codes) = documentation lift", addon_bonus, total_psych_codes, where=high_psych_volume),
+    ])
+
+    # --- PAIN: POST_ACUTE ---
+    real_margin = _float_column(df, 'net_margin', np.nan)
+    has_margin = ~np.isnan(real_margin)
+    negative_margin = has_margin & (real_margin < 0.0)
+    low_margin = has_margin & ~negative_margin & (real_margin < 0.05)
+    stable_margin = has_margin & ~negative_margin & ~low_margin
+    with np.errstate(invalid='ignore'):
+        low_margin_pain = round_vec(25 + (0.05 - real_margin) / 0.05 * 15, 1)
+    post_acute_pain = np.select([~has_margin, negative_margin, low_margin], [10.0, 40.0, low_margin_pain], default=15.0)
+    post_acute_reasoning = np.select(
+        [~has_margin, negative_margin, low_margin],
+        [
+            "+10pts: No margin data",
+            _format_vec("+40pts: Negative margin (%.1f%%)", real_margin * 100, where=negative_margin),
+            _format_vec("+%.1fpts: Low margin (%.1f%%)", low_margin_pain, real_margin * 100, where=low_margin),
+        ],
+        default=_format_vec("+15pts: Stable margin (%.1f%%)", real_margin * 100, where=stable_margin),
+    )
+
+    # --- PAIN: AMBULATORY (therapy relevance gate + procedure alignment audit) ---
+    pain_therapy = np.where(therapy_gate, pain_psych, 0)
+    reason_therapy = np.where(therapy_gate, reason_psych, '')
+    pain_procedure_alignment, reason_procedure_alignment = score_procedure_alignment_vec(df, parts['_procedure_status'], parts['_tax_idx'])
+    # Computed once for the pain, driver and label blocks. pain_undercoding is never
+    # negative, so the gated comparison pain_therapy > pain_undercoding is therapy_dominates
+    psych_dominates = pain_psych > pain_undercoding
+    therapy_dominates = therapy_gate & psych_dominates
+    has_procedure_pain = pain_procedure_alignment > 0
+    ambulatory_pain = np.where(therapy_dominates, pain_therapy, pain_undercoding)
+    capped_pain = ambulatory_pain + pain_procedure_alignment
+    ambulatory_pain = np.where(has_procedure_pain, np.where(capped_pain < 40, capped_pain, 40), ambulatory_pain)
+    ambulatory_reasoning = _join_vec([
+        np.where(
+            therapy_dominates,
+            _format_vec('+%.1fpts: %s (therapy coding dominates)', pain_therapy, reason_therapy, where=therapy_dominates),
+            _format_vec('+%.1fpts: %s', pain_undercoding, reason_undercoding, where=~therapy_dominates),
+        ),
+        _format_vec("  (Alternative: %.1fpts E&M undercoding)", pain_undercoding, where=therapy_dominates),
+        _format_vec("  (Secondary: %.1fpts therapy coding)", pain_therapy, where=~therapy_dominates & (pain_therapy > 10)),
+        np.where(has_procedure_pain, _format_vec('+%.1fpts: ', pain_procedure_alignment, where=has_procedure_pain) + reason_procedure_alignment, ''),
+    ])
+
+    pain = np.select([is_behavioral, is_post_acute], [behavioral_pain, post_acute_pain], default=ambulatory_pain)
+    pain_reasoning = np.select([is_behavioral, is_post_acute], [behavioral_reasoning, post_acute_reasoning], default=ambulatory_reasoning)
+    confidence = np.select(
+        [is_behavioral, is_post_acute],
+        [np.where(behavioral_pain >= 20, 40, 0), np.where(has_margin, 30, 0)],
+        default=np.where(ambulatory_pain >= 30, 50, 0),
+    )
+
+    # --- FIT ---
+    avg_mips_score = _float_column(df, 'avg_mips_score', np.nan)
+    has_designation = is_hpsa | is_mua
+    designation = np.select([is_hpsa & is_mua, is_hpsa, is_mua], ['HPSA/MUA', 'HPSA', 'MUA'], default='').astype(object)
+    has_providers = s2_complex > 0
+
+    vbc_mips = np.select([avg_mips_score > 80, avg_mips_score >= 60], [5, 3], default=0)
+    vbc_score = np.minimum(vbc_mips + 5 * is_aco + 5 * has_designation, 15)
+    behavioral_fit = round_vec(10 + vbc_score + np.where(5 < s2_complex, 5, s2_complex), 1)
+    behavioral_fit_reasoning = _join_vec([
+        np.full(n, "+10pts: Behavioral Health - Core ICP segment", dtype=object),
+        np.select(
+            [avg_mips_score > 80, avg_mips_score >= 60],
+            [
+                _format_vec("MIPS %.1f = VBC-ready tech infrastructure", avg_mips_score, where=avg_mips_score > 80),
+                _format_vec("MIPS %.1f = moderate tech readiness", avg_mips_score, where=(avg_mips_score <= 80) & (avg_mips_score >= 60)),
+            ],
+            default='',
+        ),
+        np.where(is_aco, "ACO participant = VBC experience", ''),
+        np.where(has_designation, designation + " = complex population, BHI opportunity", ''),
+        _format_vec("+%.1fpts: %d providers (operational capacity)", s2_complex, npi_count, where=has_providers),
+    ])
+
+    label_align = pd.Series(segment_labels).map(SEGMENT_ALIGNMENT_SCORES).fillna(5).to_numpy(dtype=np.int64)
+    s2_align = label_align[segment_codes]
+    s2_tech_risk = 3 * is_aco + 2 * is_risk
+    high_mips, distressed_mips = avg_mips_score > 80, avg_mips_score < 50
+    s2_mips = np.where(high_mips | distressed_mips, 5, 0)
+    s2_hpsa_mua = np.where(has_designation, 5, 0)
+    ambulatory_fit = round_vec(s2_align + s2_complex + s2_tech_risk + s2_mips + s2_hpsa_mua, 1)
+    ambulatory_fit_reasoning = _join_vec([
+        ('+' + label_align.astype(str).astype(object) + 'pts: ' + segment_labels + ' alignment')[segment_codes],
+        _format_vec("+%.1fpts: %d providers", s2_complex, npi_count, where=has_providers),
+        np.where(is_aco, "+3pts: ACO participant", ''),
+        np.where(is_risk, "+2pts: Compliance flag", ''),
+        np.select(
+            [high_mips, distressed_mips],
+            [
+                _format_vec("+5pts: High MIPS quality (%.1f)", avg_mips_score, where=high_mips),
+                _format_vec("+5pts: Distressed MIPS performer (%.1f)", avg_mips_score, where=distressed_mips),
+            ],
+            default='',
+        ),
+        np.where(has_designation, "+5pts: " + designation + " designated area", ''),
+    ])
+
+    fit = np.where(is_behavioral, behavioral_fit, ambulatory_fit)
+    fit_reasoning = np.where(is_behavioral, behavioral_fit_reasoning, ambulatory_fit_reasoning)
+    s2_align = np.where(is_behavioral, 10, s2_align)
+    s2_tech_risk = np.where(is_behavioral, 0, s2_tech_risk)
+    s2_mips = np.where(is_behavioral, 0, s2_mips)
+    s2_hpsa_mua = np.where(is_behavioral, 0, s2_hpsa_mua)
+
+    # --- STRATEGY + TOTAL ---
+    strat = round_vec(s3_revenue + s3_volume, 1)
+    strategy_reasoning = format_strategy_reasoning_vec(track, s3_revenue, s3_volume, est_rev, vol_metric, parts['_is_verified'])
+    total = round_vec(pain + fit + strat, 1)
+    tier = pd.Categorical.from_codes(
+        _category_codes([total >= 70, total >= 50, total >= 30], ['Tier 1', 'Tier 2', 'Tier 3'], 'Tier 4', TIER_DTYPE), dtype=TIER_DTYPE,
+    )
+
+    # --- DRIVERS ---
+    primary_pain = pain >= 25
+    therapy_risk = [psych_risk <= 0.30, psych_risk >= 0.75]
+    benchmark = np.array([DRIVER_BENCHMARK[t] for t in DRIVER_BENCHMARK], dtype=object)[parts['_track'].codes]
+    behavioral_driver = np.select(
+        therapy_risk,
+        [
+            _format_vec(DRIVER_THERAPY_UNDERCODING, psych_risk, where=therapy_risk[0]),
+            _format_vec(DRIVER_COMPLIANCE_AUDIT_RISK, psych_risk, where=therapy_risk[1]),
+        ],
+        default=_format_vec(DRIVER_THERAPY_CODING_RISK, psych_risk),
+    )
+    post_acute_driver = np.select(
+        [negative_margin, has_margin],
+        [
+            _format_vec(DRIVER_FINANCIAL_DISTRESS, real_margin * 100, where=negative_margin),
+            _format_vec(DRIVER_MARGIN_PRESSURE, real_margin * 100, where=has_margin & ~negative_margin),
+        ],
+        default="Margin Pressure",
+    )
+    procedure_driver = _format_vec(
+        DRIVER_PROCEDURE_ALIGNMENT, _float_column(df, 'procedure_ratio', 0) * 100, PROCEDURE_TARGET_RATIOS[parts['_tax_idx']] * 100,
+        where=pain_procedure_alignment >= 3,
+    )
+    therapy_driver = np.select(
+        therapy_risk,
+        [
+            _format_vec(DRIVER_THERAPY_UNDERCODING, psych_risk, where=therapy_risk[0]),
+            _format_vec(DRIVER_THERAPY_AUDIT_RISK, psych_risk, where=therapy_risk[1]),
+        ],
+        default=_format_vec(DRIVER_THERAPY_CODING_RISK, psych_risk),
+    )
+    strong_em = undercoding >= UNDERCODING_NATIONAL_AVG
+    undercoding_driver = np.select(
+        [strong_em, pain >= 35, undercoding < UNDERCODING_NATIONAL_AVG],
+        [
+            _format_vec(DRIVER_STRONG_EM, undercoding, where=strong_em),
+            _format_vec(DRIVER_SEVERE_UNDERCODING, undercoding, where=~strong_em & (pain >= 35)),
+            _format_vec(DRIVER_EM_UNDERCODING, undercoding),
+        ],
+        default='',
+    )
+    ambulatory_driver = _join_vec([
+        procedure_driver,
+        np.where(therapy_driver_gate & psych_dominates, therapy_driver, undercoding_driver),
+    ])
+    pain_driver = np.where(
+        primary_pain,
+        np.select([is_behavioral, is_post_acute], [behavioral_driver, post_acute_driver], default=ambulatory_driver),
+        benchmark,
+    )
+
+    if 'volume_source' in df.columns:
+        is_uds = df['volume_source'].astype(str).str.upper().str.contains('UDS', regex=False, na=False).to_numpy(dtype=bool)
+    else:
+        is_uds = np.zeros(n, dtype=bool)
+    # UDS counts patients; claims-based sources count encounters
+    volume_unit = np.where(is_uds, "patients", "encounters").astype(object)
+    high_volume = s3_volume >= 12
+    multi_site = ~high_volume & (site_count > 5)
+    drivers = _join_vec([
+        pain_driver,
+        np.select(
+            [~is_behavioral & (segment == 'FQHC'), ~is_behavioral & (segment == 'Urgent Care'), is_behavioral],
+            ["FQHC - Core ICP", "Urgent Care - High Fit", "Behavioral Health - Core ICP"],
+            default='',
+        ).astype(object),
+        np.where(
+            high_volume,
+            _format_vec(DRIVER_HIGH_VOLUME, vol_metric / 1000, volume_unit, where=high_volume),
+            _format_vec(DRIVER_MULTI_SITE, site_count, where=multi_site),
+        ),
+        _format_vec(DRIVER_STRONG_REVENUE, est_rev / 1000000, where=est_rev > 5_000_000),
+        np.where(is_risk, "Compliance Flag", ''),
+        np.where(is_aco, "ACO Participant", ''),
+    ])
+
+    # --- PAIN LABEL ---
+    therapy_label = therapy_dominates
+    behavioral_label = _category_codes(
+        [strong_em & (pain_psych == 0), therapy_label & therapy_risk[0], therapy_label & therapy_risk[1], therapy_label],
+        ["Low Pain - Strong Documentation", "Therapy Undercoding Pain", "Audit Risk Pain", "Therapy Coding Risk"],
+        "Undercoding Pain", PAIN_LABEL_DTYPE,
+    )
+    procedure_dominates = (pain_procedure_alignment >= 3) & (pain_procedure_alignment >= pain_psych) & (pain_procedure_alignment >= pain_undercoding)
+    ambulatory_label = _category_codes(
+        [strong_em & (pain_psych == 0) & (pain_procedure_alignment == 0), procedure_dominates,
+         therapy_label & therapy_risk[0], therapy_label & therapy_risk[1], therapy_label],
+        ["Low Pain - Strong Documentation", "Procedure Alignment Pain", "Therapy Undercoding Pain", "Therapy Audit Risk", "Therapy Coding Risk"],
+        "Undercoding Pain", PAIN_LABEL_DTYPE,
+    )
+    margin_label = PAIN_LABEL_DTYPE.categories.get_loc("Margin Pressure")
+    pain_label = pd.Categorical.from_codes(
+        np.select([is_behavioral, is_post_acute], [behavioral_label, margin_label], default=ambulatory_label), dtype=PAIN_LABEL_DTYPE,
+    )
+
+    tally_procedure_data_quality(parts['_procedure_status'], parts['_tax_idx'])
+
+    icp_score = np.where(total < 100, total, 100)
+    # The frame wraps these arrays without copying, so no two columns may share one.
+    # Whole-point components are bounded well inside int8; the float scores stay float64
+    scores = {
+        'icp_score': icp_score,
+        'icp_tier': tier,
+        'segment_label': segment,
+        'fqhc_flag': df['fqhc_flag'].to_numpy(copy=True) if 'fqhc_flag' in df.columns else np.zeros(n, dtype=np.int8),
+        'scoring_track': parts['_track'],
+        'pain_label': pain_label,
+        'data_confidence': np.minimum(100, confidence).astype(np.int8),
+        'scoring_drivers': np.where(drivers == '', "Standard", drivers),
+        'score_pain_total': round_vec(pain, 1),
+        'score_pain_signal': round_vec(pain, 1),
+        'score_fit_total': round_vec(fit, 1),
+        'score_fit_align': s2_align.astype(np.int8),
+        'score_fit_complex': round_vec(s2_complex, 1),
+        'score_fit_risk': s2_tech_risk.astype(np.int8),
+        'score_fit_mips': s2_mips.astype(np.int8),
+        'score_fit_hpsa_mua': s2_hpsa_mua.astype(np.int8),
+        'score_strat_total': strat,
+        'score_strat_deal': round_vec(s3_revenue, 1),
+        'score_strat_expand': round_vec(s3_volume, 1),
+        'score_base_before_bonus': icp_score.copy(),
+        'metric_est_revenue': est_rev,
+        'metric_used_volume': vol_metric,
+        'volume_unit': volume_unit,
+        'score_reasoning_pain': pain_reasoning,
+        'score_reasoning_fit': fit_reasoning,
+        'score_reasoning_strategy': strategy_reasoning,
+    }
+    # Components no track awards yet
+    for column in ('score_pain_volume', 'score_pain_margin', 'score_pain_compliance', 'score_fit_chaos', 'score_strat_ref', 'score_bonus_strategic_scale'):
+        scores[column] = np.zeros(n, dtype=np.int8)
+    return pd.DataFrame(scores, index=df.index, columns=SCORE_COLUMNS, copy=False)
+
+# Every field calculate_row_score reads; calculate_score caches on these alone
+SCORING_FIELDS = (
+    'avg_mips_score', 'final_volume', 'fqhc_flag', 'fqhc_revenue', 'hha_revenue', 'hospital_total_revenue',
+    'is_aco_participant', 'is_hpsa', 'is_mua', 'net_margin', 'npi_count', 'oig_leie_flag', 'org_name',
+    'procedure_ratio', 'psych_risk_ratio', 'real_medicare_revenue', 'risk_compliance_flag', 'segment_label',
+    'services_count', 'site_count', 'taxonomy', 'total_eval_codes', 'total_procedure_codes', 'total_psych_codes',
+    'total_revenue', 'undercoding_ratio', 'volume_source',
+)
+
+@lru_cache(maxsize=100_000)
+def _cached_row_score(key):
+    return calculate_row_score({field: value for field, _, value in key})
+
+def _row_score(row_dict):
+    """
+    calculate_row_score memoized on the SCORING_FIELDS present in `row_dict`.
+    Keys carry each value's type (True, 1 and 1.0 hash alike but score
+    differently); rows with unhashable values are scored uncached.
+    """
+    key = tuple((field, type(row_dict[field]), row_dict[field]) for field in SCORING_FIELDS if field in row_dict)
+    try:
+        return _cached_row_score(key)
+    except TypeError:
+        return calculate_row_score(row_dict)
+
 def calculate_score(row_dict):
-    row = pd.Series(row_dict)
-    result = calculate_row_score(row)
+    result = _row_score(row_dict)
     return {
         'total': result['icp_score'], 'tier': result['icp_tier'], 'confidence': result['data_confidence'], 'rationale': result['scoring_drivers'],
         'estimates': {'revenue': result['metric_est_revenue'], 'encounters': result['metric_used_volume']},
@@ -761,13 +1470,87 @@ def calculate_score(row_dict):
         }
     }
 
+def county_merge_keys(left_state, left_county, right_state, right_county):
+    """
+    Normalize (state, county) on both sides of the HPSA/MUA join and factorize
+    the pairs jointly into one int64 key per row, so the merge hashes a single
+    integer column. Missing values get their own code and still match each other.
+    """
+    n = len(left_state)
+    state = pd.concat([left_state, right_state], ignore_index=True).str.upper().str.strip()
+    county = pd.concat([left_county, right_county], ignore_index=True).str.strip().str.title()
+    state_codes = pd.factorize(state, use_na_sentinel=False)[0].astype(np.int64)
+    county_codes, counties = pd.factorize(county, use_na_sentinel=False)
+    key = state_codes * len(counties) + county_codes
+    return key[:n], key[n:]
+
+def columnar_copy(df):
+    """
+    df as CSV readers see it: the scorer stringifies a missing segment_label to
+    'nan', which the CSV round-trip reads back as null, so the typed copies store NA.
+    """
+    if 'segment_label' not in df.columns:
+        return df
+    return df.assign(segment_label=df['segment_label'].mask(df['segment_label'] == 'nan'))
+
+def save_scored_parquet(df, path):
+    """Write the scored clinics as Parquet next to the CSV; the CSV stays the source of truth."""
+    try:
+        columnar_copy(df).to_parquet(path, index=False, compression='zstd')
+        print(f"💾 Saved to {path}")
+    except Exception as e:
+        print(f"⚠️  Could not write Parquet copy ({e}). Readers will fall back to CSV.")
+
+def save_scored_arrow(df, path):
+    """
+    Write the scored clinics as an Arrow IPC file next to the CSV. Tier, track
+    and pain labels arrive dictionary-encoded from their categoricals;
+    segment_label is encoded here.
+    """
+    try:
+        table = pa.Table.from_pandas(columnar_copy(df), preserve_index=False)
+        if 'segment_label' in table.column_names:
+            i = table.schema.get_field_index('segment_label')
+            table = table.set_column(i, 'segment_label', table.column(i).dictionary_encode())
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        print(f"💾 Saved to {path}")
+    except Exception as e:
+        print(f"⚠️  Could not write Arrow copy ({e}).")
+
+# Low-cardinality label columns load_scored_clinics returns as categoricals
+SCORED_LABEL_COLUMNS = ['segment_label', 'pain_label', 'scoring_track']
+
+def load_scored_clinics(columns, dtypes=None, path=OUTPUT_FILE):
+    """
+    Read the scored clinics for downstream checks, preferring the Parquet copy
+    unless the CSV at `path` is newer. Columns the file lacks are skipped.
+
+    Label columns are categoricals built from the observed values on either
+    path (Parquet keeps the scorer's full label lists), so both sources give
+    the same frame.
+    """
+    parquet_path = path.replace(".csv", ".parquet")
+    dtypes = dtypes or {}
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(path):
+        present = pq.read_schema(parquet_path).names
+        df = pd.read_parquet(parquet_path, columns=[col for col in columns if col in present])
+        labels = [col for col in SCORED_LABEL_COLUMNS if col in df.columns]
+        df = df.astype({**dict.fromkeys(labels, str), **{col: dtype for col, dtype in dtypes.items() if col in df.columns}})
+        return df.astype(dict.fromkeys(labels, 'category'))
+
+    # Peek at the header so older scored files without some columns still load
+    present = pd.read_csv(path, nrows=0).columns
+    usecols = [col for col in columns if col in present]
+    return pd.read_csv(path, engine='pyarrow', usecols=usecols, dtype={**dtypes, **dict.fromkeys(SCORED_LABEL_COLUMNS, 'category')})
+
 def main():
     print("🚀 RUNNING CONTINUOUS SCORING ENGINE v12.0...")
     if not os.path.exists(INPUT_FILE):
         print(f"❌ Input file missing: {INPUT_FILE}")
         return
 
-    df = pd.read_csv(INPUT_FILE, low_memory=False)
+    df = pd.read_csv(INPUT_FILE, engine='pyarrow', dtype=INPUT_DTYPES)
     print(f"Loaded {len(df):,} clinics.")
 
     if os.path.exists(MIPS_STAGING):
@@ -787,22 +1570,21 @@ def main():
         hpsa_mua_df = pd.read_csv(HPSA_MUA_STAGING)
         if 'county_name' in df.columns and df['county_name'].notna().sum() > 0:
             print(f"   ✅ County data available - using county-level matching")
-            df['state_norm'] = df['state_code'].str.upper().str.strip()
-            df['county_norm'] = df['county_name'].str.strip().str.title()
-            hpsa_mua_df['state_norm'] = hpsa_mua_df['state'].str.upper().str.strip()
-            hpsa_mua_df['county_norm'] = hpsa_mua_df['county_name'].str.strip().str.title()
-            df = df.merge(hpsa_mua_df[['state_norm', 'county_norm', 'is_hpsa', 'is_mua']], on=['state_norm', 'county_norm'], how='left')
-            df.drop(columns=['state_norm', 'county_norm'], inplace=True)
+            df_key, hpsa_key = county_merge_keys(df['state_code'], df['county_name'], hpsa_mua_df['state'], hpsa_mua_df['county_name'])
+            hpsa_mua_df = hpsa_mua_df[['is_hpsa', 'is_mua']].assign(geo_key=hpsa_key)
+            df = df.assign(geo_key=df_key).merge(hpsa_mua_df, on='geo_key', how='left')
+            df.drop(columns=['geo_key'], inplace=True)
             df['is_hpsa'] = df['is_hpsa'].fillna(False).astype(bool)
             df['is_mua'] = df['is_mua'].fillna(False).astype(bool)
             print(f"   ✅ Matched {df['is_hpsa'].sum():,} clinics in HPSA counties")
             print(f"   ✅ Matched {df['is_mua'].sum():,} clinics in MUA counties")
         else:
             print(f"   ⚠️  No county data available - using state-level fallback")
-            hpsa_states = set(hpsa_mua_df[hpsa_mua_df['is_hpsa']]['state'].unique())
-            mua_states = set(hpsa_mua_df[hpsa_mua_df['is_mua']]['state'].unique())
-            df['is_hpsa'] = df['state_code'].isin(hpsa_states)
-            df['is_mua'] = df['state_code'].isin(mua_states)
+            # One row of (is_hpsa, is_mua) per state, looked up for every clinic in a single reindex
+            state_flags = hpsa_mua_df.groupby('state', dropna=False)[['is_hpsa', 'is_mua']].any()
+            clinic_flags = state_flags.reindex(df['state_code'].to_numpy(), fill_value=False)
+            df['is_hpsa'] = clinic_flags['is_hpsa'].to_numpy()
+            df['is_mua'] = clinic_flags['is_mua'].to_numpy()
             print(f"   ✅ Marked {df['is_hpsa'].sum():,} clinics in HPSA states")
             print(f"   ✅ Marked {df['is_mua'].sum():,} clinics in MUA states")
     else:
@@ -811,31 +1593,39 @@ def main():
         df['is_mua'] = False
 
     cols_to_numeric = ['services_count', 'final_volume', 'total_revenue', 'npi_count', 'undercoding_ratio', 'net_margin', 'hospital_margin', 'hha_margin', 'fqhc_margin', 'hospital_total_revenue', 'fqhc_revenue', 'hha_revenue', 'real_medicare_revenue', 'psych_risk_ratio', 'total_psych_codes', 'site_count']
-    for c in cols_to_numeric:
-        if c in df.columns: df[c] = pd.to_numeric(df[c], errors='coerce')
+    # The pyarrow reader already types clean numeric columns; coerce the ones that came back as text in one assignment
+    text_cols = [c for c in cols_to_numeric if c in df.columns and not pd.api.types.is_numeric_dtype(df[c])]
+    if text_cols: df[text_cols] = df[text_cols].apply(pd.to_numeric, errors='coerce')
 
     print("Calculating continuous scores...")
-    scores = df.apply(calculate_row_score, axis=1, result_type='expand')
-    
-    cols_to_drop = [c for c in scores.columns if c in df.columns]
-    if cols_to_drop: df.drop(columns=cols_to_drop, inplace=True)
+    scores = score_dataframe(df)
+
+    # Stale score columns from a previous run are removed first so the fresh ones land at the end
+    for c in scores.columns:
+        if c in df.columns: del df[c]
+    for c in scores.columns:
+        df[c] = scores[c]
 
-    final_df = pd.concat([df, scores], axis=1)
-    final_df.sort_values('icp_score', ascending=False, inplace=True)
+    final_df = df.sort_values('icp_score', ascending=False)
 
     final_df.to_csv(OUTPUT_FILE, index=False)
     print(f"💾 Saved to {OUTPUT_FILE}")
+    save_scored_parquet(final_df, OUTPUT_PARQUET)
+    save_scored_arrow(final_df, OUTPUT_ARROW)
 
     print("\n📊 CONTINUOUS SCORING RESULTS BY TRACK:")
+    # One grouped pass for the per-track stats and one for the track x tier counts
+    track_stats = final_df.groupby('scoring_track', observed=True)['icp_score'].agg(['size', 'mean', 'min', 'max'])
+    track_tiers = final_df.groupby(['scoring_track', 'icp_tier'], observed=True).size().unstack(fill_value=0)
     for track in ['AMBULATORY', 'BEHAVIORAL', 'POST_ACUTE']:
-        track_df = final_df[final_df['scoring_track'] == track]
-        if len(track_df) > 0:
-            print(f"\n{track} Track ({len(track_df):,} clinics):")
-            print(f"  Avg Score: {track_df['icp_score'].mean():.1f}")
-            print(f"  Score Range: {track_df['icp_score'].min():.1f} - {track_df['icp_score'].max():.1f}")
-            tier_counts = track_df['icp_tier'].value_counts()
+        if track in track_stats.index:
+            stats = track_stats.loc[track]
+            print(f"\n{track} Track ({int(stats['size']):,} clinics):")
+            print(f"  Avg Score: {stats['mean']:.1f}")
+            print(f"  Score Range: {stats['min']:.1f} - {stats['max']:.1f}")
+            tier_counts = track_tiers.loc[track]
             for tier in ['Tier 1', 'Tier 2', 'Tier 3', 'Tier 4']:
-                print(f"  {tier}: {tier_counts.get(tier, 0):,}")
+                print(f"  {tier}: {int(tier_counts.get(tier, 0)):,}")
 
     print("\n📊 OVERALL TIER DISTRIBUTION:")
     print(final_df['icp_tier'].value_counts())
@@ -4,7 +4,7 @@ Test suite for the feature enrichment pipeline, specifically the `assign_segment
 
 import pytest
 import pandas as pd
-from workers.pipeline.enrich_features import assign_segment
+from workers.pipeline.enrich_features import assign_segment, assign_segment_vec
 
 # Test cases for the `assign_segment` function
 
@@ -67,3 +67,18 @@ def test_fqhc_priority():
     """Test that the FQHC flag takes priority over all other rules."""
     row = pd.Series({"org_name": "General Hospital", "taxonomy": "282N00000X", "fqhc_flag": 1})
     assert assign_segment(row) == "FQHC"
+
+def test_assign_segment_vec_matches_row_logic():
+    """Test that the vectorized segment assignment agrees with assign_segment row by row."""
+    df = pd.DataFrame([
+        {"fqhc_flag": 1, "taxonomy": "282N00000X", "org_name": "General Hospital"},
+        {"fqhc_flag": 0, "taxonomy": "363L00000X; 282N00000X", "org_name": "The Clinic"},
+        {"fqhc_flag": 0, "taxonomy": " 261QU0200X ;207Q00000X", "org_name": None},
+        {"fqhc_flag": 0, "taxonomy": "261QU0200XY", "org_name": "Urgent Care"},
+        {"fqhc_flag": 0, "taxonomy": "193200000X", "org_name": "Hospital"},
+        {"fqhc_flag": 0, "taxonomy": None, "org_name": "Urgent Care Hospital"},
+        {"fqhc_flag": 0, "taxonomy": "", "org_name": "Behavioral Home Health"},
+        {"fqhc_flag": None, "taxonomy": "174400000X", "org_name": "home health partners"},
+    ])
+    expected = [assign_segment(row) for _, row in df.iterrows()]
+    assert assign_segment_vec(df).tolist() == expected
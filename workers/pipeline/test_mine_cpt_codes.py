@@ -0,0 +1,30 @@
+"""
+Unit tests for the CPT mining helpers in `mine_cpt_codes`.
+"""
+
+import pandas as pd
+from workers.pipeline.mine_cpt_codes import is_procedure_code, lookup_org_npis, procedure_code_mask, sort_bridge
+
+
+def test_procedure_code_mask_matches_scalar_check():
+    """The vectorized mask should agree with `is_procedure_code` code-for-code."""
+    codes = pd.Series(['10000', '69999', '70000', '99213', '09999', '2000F', 'G0402', '123', '', '45378'])
+    expected = [is_procedure_code(code) for code in codes]
+    assert procedure_code_mask(codes).tolist() == expected
+
+
+def test_procedure_code_mask_handles_missing_codes():
+    """Missing HCPCS codes are never procedures."""
+    codes = pd.Series(['45378', None])
+    assert procedure_code_mask(codes).tolist() == [True, False]
+
+
+def test_lookup_org_npis_matches_inner_merge():
+    """Every (individual, org) pair an inner merge finds, including multi-org individuals."""
+    bridge = pd.DataFrame({'indiv_npi': [3, 1, 3, 2, 3], 'org_npi': [30, 10, 31, 20, 32]})
+    npis = pd.Series([3, 4, 1, 3, 2])
+
+    rows, org_npi = lookup_org_npis(sort_bridge(bridge), npis.to_numpy())
+
+    merged = npis.rename('indiv_npi').to_frame().merge(bridge, on='indiv_npi', how='inner')
+    assert sorted(zip(npis.to_numpy()[rows], org_npi)) == sorted(zip(merged['indiv_npi'], merged['org_npi']))
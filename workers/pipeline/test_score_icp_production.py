@@ -3,14 +3,32 @@ Unit tests for the ICP scoring engine, specifically for the
 `calculate_row_score` function and the "Therapy Relevance Gate" logic.
 """
 import pytest
+import numpy as np
 import pandas as pd
 import sys
 import os
+import re
+import inspect
 
 # Add parent directory to path to allow module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
-from workers.pipeline.score_icp_production import calculate_row_score
+from workers.pipeline import score_icp_production
+from workers.pipeline.score_icp_production import (
+    SCORE_COLUMNS,
+    SCORING_FIELDS,
+    calculate_row_score,
+    calculate_score,
+    format_strategy_reasoning_vec,
+    score_all_continuous,
+    score_dataframe,
+    score_psych_risk_continuous,
+    score_psych_risk_vec,
+    score_undercoding_continuous,
+    score_undercoding_vec,
+    therapy_gates,
+    therapy_gates_vec,
+)
 
 @pytest.fixture
 def base_clinic_data():
@@ -140,4 +158,159 @@ def test_hospital_revenue_no_downgrade(base_clinic_data):
     result = calculate_row_score(row)
 
     # The segment label should remain 'Hospital'
-    assert result['segment_label'] == 'Hospital'
\ No newline at end of file
+    assert result['segment_label'] == 'Hospital'
+
+def test_undercoding_vec_matches_scalar():
+    """
+    Tests that the vectorized undercoding kernel agrees with the scalar
+    scorer across every branch, including missing data.
+    """
+    # 0.2286 and 0.2154 land next to a halfway score (33.45, 34.55)
+    ratios = [np.nan, -0.1, 0.0, 0.05, 0.15, 0.2, 0.2154, 0.2286, 0.3, 0.449, 0.45, 0.8]
+    scores, reasons = score_undercoding_vec(np.array(ratios))
+
+    for ratio, score, reason in zip(ratios, scores, reasons):
+        assert (score, reason) == score_undercoding_continuous(ratio)
+
+def test_psych_risk_vec_matches_scalar():
+    """
+    Tests that the vectorized psych-risk kernel agrees with the scalar
+    scorer on both sides of the 40-60% sweet spot.
+    """
+    # 0.3095 and 0.3965 land next to a halfway score (37.15, 11.05)
+    ratios = [np.nan, 0.0, 0.1, 0.3, 0.3095, 0.35, 0.3965, 0.4, 0.5, 0.6, 0.7, 0.75, 0.9]
+    scores, reasons = score_psych_risk_vec(np.array(ratios))
+
+    for ratio, score, reason in zip(ratios, scores, reasons):
+        assert (score, reason) == score_psych_risk_continuous(ratio)
+
+def test_strategy_reasoning_vec_matches_scalar(base_clinic_data):
+    """
+    Tests that the vectorized strategy reasoning matches the strings the
+    scalar scorer builds, across tracks, missing revenue and missing volume.
+    """
+    variants = [
+        {},
+        {'segment_label': 'FQHC', 'total_revenue': np.nan, 'volume_source': 'HRSA UDS'},
+        {'segment_label': 'Behavioral Health', 'org_name': 'Mind Counseling'},
+        {'total_revenue': np.nan, 'services_count': np.nan, 'final_volume': np.nan},
+        {'services_count': 1234567.9, 'total_revenue': 123_456_789},
+    ]
+    df = pd.DataFrame([{**base_clinic_data, **variant} for variant in variants])
+    precomputed = score_all_continuous(df)
+    expected = [calculate_row_score(row) for _, row in df.iterrows()]
+
+    reasons = format_strategy_reasoning_vec(
+        precomputed['_track'], precomputed['_s3_revenue'], precomputed['_s3_volume'],
+        np.array([result['metric_est_revenue'] for result in expected], dtype=float),
+        np.array([result['metric_used_volume'] for result in expected], dtype=float),
+        precomputed['_is_verified'],
+    )
+
+    assert list(reasons) == [result['score_reasoning_strategy'] for result in expected]
+
+def test_therapy_gates_vec_matches_scalar():
+    """
+    Tests that the vectorized therapy relevance gates agree with the scalar
+    gates, including the missing-eval-codes edge case that only closes the
+    pain/label gate.
+    """
+    df = pd.DataFrame({
+        'total_psych_codes': [800, 302, 2306, 99, 300, 150, np.nan],
+        'total_eval_codes': [200, np.nan, 171595, 0, 900, 0, 50],
+        'psych_risk_ratio': [0.3, 0.2, 0.4, 0.5, np.nan, 0.6, 0.2],
+    })
+    gate, driver_gate = therapy_gates_vec(df)
+
+    for i, (psych, eval_codes, psych_risk) in enumerate(df.itertuples(index=False)):
+        psych = 0 if np.isnan(psych) else psych
+        psych_risk = 0 if np.isnan(psych_risk) else psych_risk
+        assert (gate[i], driver_gate[i]) == therapy_gates(psych, eval_codes, psych_risk)
+
+def test_score_columns_match_row_score(base_clinic_data):
+    """
+    Tests that SCORE_COLUMNS lists calculate_row_score's output keys in order,
+    so the vectorized scorer emits the same column layout.
+    """
+    result = calculate_row_score(pd.Series(base_clinic_data))
+
+    assert list(result) == SCORE_COLUMNS
+
+def test_row_score_accepts_plain_dict(base_clinic_data):
+    """
+    Tests that calculate_row_score gives the same result for a plain dict
+    as for a pandas row, and that calculate_score takes dicts directly.
+    """
+    clinic = {**base_clinic_data, 'total_revenue': None, 'segment_label': 'Behavioral Health'}
+
+    assert calculate_row_score(clinic) == calculate_row_score(pd.Series(clinic))
+    assert calculate_score(clinic)['total'] == calculate_row_score(clinic)['icp_score']
+
+def test_scoring_fields_cover_row_reads():
+    """
+    Tests that the calculate_score cache key lists every field the row
+    scorer reads, so a cached result can never go stale on an unkeyed field.
+    """
+    source = inspect.getsource(score_icp_production)
+    assert set(re.findall(r"row\.get\('(\w+)'", source)) <= set(SCORING_FIELDS)
+
+def test_calculate_score_cache_keys_on_value_types(base_clinic_data):
+    """
+    Tests that memoized scoring keeps 1 and True apart (they hash alike but
+    score differently) and still scores rows holding unhashable values.
+    """
+    as_int = calculate_score({**base_clinic_data, 'is_aco_participant': 1})
+    as_bool = calculate_score({**base_clinic_data, 'is_aco_participant': True})
+
+    assert as_int['breakdown']['fit_total'] != as_bool['breakdown']['fit_total']
+    assert calculate_score({**base_clinic_data, 'is_aco_participant': True}) == as_bool
+    assert calculate_score({**base_clinic_data, 'taxonomy': ['207X00000X']})['total'] > 0
+
+def test_score_dataframe_matches_row_score(base_clinic_data):
+    """
+    Tests that the vectorized frame scorer produces exactly what the row
+    scorer does, across all three tracks and the main pain branches.
+    """
+    variants = [
+        {},
+        {'segment_label': 'FQHC', 'total_psych_codes': 400, 'total_eval_codes': 600, 'psych_risk_ratio': 0.8},
+        {'segment_label': 'Behavioral Health', 'total_psych_codes': 3000, 'avg_mips_score': 65, 'is_hpsa': 'true'},
+        {'segment_label': 'Hospital', 'total_revenue': 2_000_000, 'net_margin': -0.05},
+        {'segment_label': 'Home Health', 'net_margin': np.nan, 'is_aco_participant': 'True'},
+        {'taxonomy': '207X00000X', 'total_procedure_codes': 100, 'total_eval_codes': 400, 'procedure_ratio': 0.05},
+        {'segment_label': 'Urgent Care', 'undercoding_ratio': 0.1, 'npi_count': np.nan, 'services_count': 60_000},
+    ]
+    df = pd.DataFrame([{**base_clinic_data, **variant} for variant in variants])
+    expected = pd.DataFrame([calculate_row_score(row) for _, row in df.iterrows()])
+
+    scores = score_dataframe(df)
+    label_columns = ['icp_tier', 'pain_label', 'scoring_track']
+    assert all(isinstance(scores[col].dtype, pd.CategoricalDtype) for col in label_columns)
+
+    scores = scores.astype({col: object for col in label_columns})
+    pd.testing.assert_frame_equal(scores, expected, check_dtype=False)
+
+def test_score_dataframe_rounds_halfway_sums_like_row_score(base_clinic_data):
+    """
+    Tests that both scorers use one rounding rule on scores that land on an
+    x.x5 sum (np.round and the built-in round can disagree there), whether
+    the row holds NumPy or plain Python numbers.
+    """
+    variants = [
+        # psych pain 10 + add-on bonus 3.05 -> 13.05 pain, 53.45 total
+        {'segment_label': 'Behavioral Health', 'total_psych_codes': 610, 'psych_risk_ratio': 0.5},
+        {'segment_label': 'Behavioral Health', 'total_psych_codes': 530, 'psych_risk_ratio': 0.3095},
+        # low-margin pain 25 + 10.35 -> 35.35
+        {'segment_label': 'Home Health', 'net_margin': 0.0155},
+        {'segment_label': 'Home Health', 'net_margin': 0.0385},
+    ]
+    rows = [{**base_clinic_data, **variant} for variant in variants]
+    df = pd.DataFrame(rows)
+    expected = pd.DataFrame([calculate_row_score(row) for _, row in df.iterrows()])
+
+    assert expected['score_pain_total'].tolist() == [13.1, 39.8, 35.4, 28.5]
+    assert [calculate_row_score(row) for row in rows] == expected.to_dict('records')
+
+    scores = score_dataframe(df)
+    scores = scores.astype({col: object for col in ['icp_tier', 'pain_label', 'scoring_track']})
+    pd.testing.assert_frame_equal(scores, expected, check_dtype=False)